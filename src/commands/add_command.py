@@ -15,12 +15,14 @@ RESPONSABILITATI:
 """
 
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from .base import Command
+from ..config.settings import ADD_BATCH_SIZE
 from ..database.models import Series
-from ..scrapers.imdb_scraper import IMDBScraper
 from ..utils.validators import (
+    parse_identifier,
     validate_series_name,
     validate_imdb_link,
     validate_score,
@@ -28,29 +30,68 @@ from ..utils.validators import (
 )
 
 
+# Static texts, built once at import instead of on every call
+_USAGE_MISSING_ARGS = (
+    "{err}\n\n"
+    "Usage:\n"
+    "  add <name> [score]              - Auto-lookup IMDB ID\n"
+    "  add <name> <imdb_id> [score]    - With explicit IMDB ID\n\n"
+    "Examples:\n"
+    "  add \"Breaking Bad\" 9\n"
+    "  add \"Breaking Bad\" tt0903747 9"
+)
+
+_USAGE_INVALID_IMDB = (
+    "{err}\n\n"
+    "The IMDB ID should look like: tt0903747\n"
+    "Or simply omit it and we'll search by name:\n"
+    "  add \"Breaking Bad\" 9"
+)
+
+_USAGE_ALREADY_EXISTS = (
+    "{err}\n\n"
+    "Use 'list' to see your tracked series\n"
+    "Use 'delete <imdb_id>' to remove and re-add"
+)
+
+_HELP_TEXT = """
+Add a new series to track.
+
+Usage:
+  add <name> [score]              Auto-lookup IMDB ID by series name
+  add <name> <imdb_id> [score]    With explicit IMDB ID
+
+Arguments:
+  name              Series name (use quotes if it contains spaces)
+  imdb_id           IMDB ID (e.g., tt0903747) or full IMDB URL
+  score             Optional: Your rating (1-10, default: 5)
+
+Examples:
+  add "Breaking Bad" 9                    # Auto-lookup
+  add "Breaking Bad" tt0903747 9          # With IMDB ID
+  add "The Office" 8                      # May show options if multiple matches
+  add "Stranger Things" tt4574334
+
+Batch mode:
+  add-batch < series.txt                  # One add line per series
+        """
+
+
 class AddCommand(Command):
     """Command to add a new series to tracking."""
     
     def __init__(self, db_manager):
-        """Initialize with database manager and IMDB scraper."""
+        """Initialize with database manager (IMDB scraper is created on first use)."""
         super().__init__(db_manager)
-        self.imdb_scraper = IMDBScraper()
-    
-    def _is_imdb_id(self, value: str) -> bool:
-        """Check if a value looks like an IMDB ID or URL."""
-        if not value:
-            return False
-        value_lower = value.lower()
-        # Check for tt prefix (IMDB ID) or imdb.com URL
-        return value_lower.startswith('tt') or 'imdb.com' in value_lower
+        self._imdb_scraper = None
     
-    def _is_numeric_score(self, value: str) -> bool:
-        """Check if a value looks like a numeric score."""
-        try:
-            score = int(value)
-            return 1 <= score <= 10
-        except (ValueError, TypeError):
-            return False
+    @property
+    def imdb_scraper(self):
+        """IMDB scraper, imported and created only when a search is needed."""
+        if self._imdb_scraper is None:
+            from ..scrapers.imdb_scraper import IMDBScraper
+            self._imdb_scraper = IMDBScraper()
+        return self._imdb_scraper
     
     def execute(self, args):
         """
@@ -70,14 +111,8 @@ class AddCommand(Command):
             try:
                 # Validate argument count
                 if len(args) < 1:
-                    return (
-                        self.error_msg("Missing required arguments") + "\n\n"
-                        "Usage:\n"
-                        "  add <name> [score]              - Auto-lookup IMDB ID\n"
-                        "  add <name> <imdb_id> [score]    - With explicit IMDB ID\n\n"
-                        "Examples:\n"
-                        "  add \"Breaking Bad\" 9\n"
-                        "  add \"Breaking Bad\" tt0903747 9"
+                    return _USAGE_MISSING_ARGS.format(
+                        err=self.error_msg("Missing required arguments")
                     )
                 
                 name = args[0]
@@ -86,26 +121,28 @@ class AddCommand(Command):
                 
                 # Detect argument pattern
                 if len(args) >= 2:
-                    second_arg = args[1]
+                    # Classified once; the result is reused for validation
+                    second_arg = parse_identifier(args[1])
                     
-                    if self._is_imdb_id(second_arg):
+                    if second_arg.is_imdb:
                         # Pattern: add <name> <imdb_id> [score]
                         imdb_id = second_arg
                         if len(args) >= 3:
                             score = args[2]
-                    elif self._is_numeric_score(second_arg):
+                    elif second_arg.kind == 'score':
                         # Pattern: add <name> <score>
-                        score = second_arg
+                        score = args[1]
                         # imdb_id remains None - will search
                     else:
                         # This looks like a plain word - likely an unquoted multi-word name
                         # e.g., add Breaking Bad 9 → ["Breaking", "Bad", "9"]
                         # Give a helpful error message
-                        possible_full_name = " ".join(args[:-1]) if self._is_numeric_score(args[-1]) else " ".join(args)
+                        last_is_score = parse_identifier(args[-1]).kind == 'score'
+                        possible_full_name = " ".join(args[:-1]) if last_is_score else " ".join(args)
                         return (
                             self.error_msg("It looks like the series name contains spaces") + "\n\n"
                             "Please use quotes around names with spaces:\n"
-                            f'  add "{possible_full_name}" {args[-1] if self._is_numeric_score(args[-1]) else "9"}\n\n'
+                            f'  add "{possible_full_name}" {args[-1] if last_is_score else "9"}\n\n'
                             "Examples:\n"
                             '  add "Breaking Bad" 9\n'
                             '  add "Game of Thrones" tt0944947 10'
@@ -121,7 +158,7 @@ class AddCommand(Command):
                     return self._handle_search_and_add(validated_name, validated_score, op)
                 
                 # IMDB ID was provided - traditional flow
-                op.debug(f"Validating IMDB ID: {imdb_id}")
+                op.debug(f"Validating IMDB ID: {imdb_id.value}")
                 validated_imdb_id = validate_imdb_link(imdb_id)
                 
                 return self._add_series_to_db(
@@ -131,21 +168,16 @@ class AddCommand(Command):
             except ValidationError as e:
                 op.error(f"Validation: {e}")
                 if "IMDB" in str(e):
-                    return (
-                        self.error_msg(f"Invalid IMDB ID: {e}") + "\n\n"
-                        "The IMDB ID should look like: tt0903747\n"
-                        "Or simply omit it and we'll search by name:\n"
-                        "  add \"Breaking Bad\" 9"
+                    return _USAGE_INVALID_IMDB.format(
+                        err=self.error_msg(f"Invalid IMDB ID: {e}")
                     )
                 return self.error_msg(f"Validation error: {e}")
             
             except ValueError as e:
                 op.error(str(e))
                 if "already exists" in str(e).lower():
-                    return (
-                        self.error_msg("Series already exists in database") + "\n\n"
-                        "Use 'list' to see your tracked series\n"
-                        "Use 'delete <imdb_id>' to remove and re-add"
+                    return _USAGE_ALREADY_EXISTS.format(
+                        err=self.error_msg("Series already exists in database")
                     )
                 return self.error_msg(str(e))
             
@@ -165,7 +197,11 @@ class AddCommand(Command):
         Returns:
             str: Result message
         """
-        results = self.imdb_scraper.search_series(name)
+        # The similar-name check only needs the typed name, so run it on a
+        # worker thread while the IMDB request is in flight
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            similar_future = pool.submit(self.db_manager.find_similar_by_name, name)
+            results = self.imdb_scraper.search_series(name)
         
         if not results:
             op.error(f"No results found for '{name}'")
@@ -181,7 +217,10 @@ class AddCommand(Command):
             # Single match - auto-add
             result = results[0]
             op.debug(f"Single match found: {result.imdb_id} - {result.title}")
-            return self._add_series_to_db(name, result.imdb_id, score, op)
+            return self._add_series_to_db(
+                name, result.imdb_id, score, op,
+                similar_series=similar_future.result()
+            )
         
         # Multiple matches - show options
         op.debug(f"Multiple matches found: {len(results)}")
@@ -201,7 +240,8 @@ class AddCommand(Command):
         
         return "\n".join(lines)
     
-    def _add_series_to_db(self, name: str, imdb_id: str, score: int, op):
+    def _add_series_to_db(self, name: str, imdb_id: str, score: int, op,
+                          similar_series=None):
         """
         Add series to the database.
         
@@ -210,12 +250,17 @@ class AddCommand(Command):
             imdb_id: IMDB ID
             score: User score
             op: Operation logger context
+            similar_series: Result of find_similar_by_name(name), if it was
+                            already computed (only the IMDB ID is checked then)
             
         Returns:
             str: Success message
         """
-        # Check for duplicates (by IMDB ID and by similar name)
-        existing_by_id = self.db_manager.find_by_imdb_id(imdb_id)
+        if similar_series is None:
+            # Check for duplicates (by IMDB ID and by similar name) in one query
+            existing_by_id, similar_series = self.db_manager.find_duplicates(imdb_id, name)
+        else:
+            existing_by_id = self.db_manager.get_series(imdb_id)
         if existing_by_id:
             op.debug(f"Series with IMDB ID {imdb_id} already exists")
             return (
@@ -226,8 +271,7 @@ class AddCommand(Command):
                 "Use 'update' to modify this series."
             )
         
-        # Check for similar names (duplicate detection)
-        similar_series = self.db_manager.find_similar_by_name(name)
+        # Similar names (duplicate detection)
         duplicate_warning = ""
         if similar_series:
             op.debug(f"Found {len(similar_series)} similar series")
@@ -267,27 +311,109 @@ class AddCommand(Command):
             f"  • Use 'update episode {imdb_id} S01E01' to mark watched"
         )
     
-    def info_msg(self, msg: str) -> str:
-        """Format an info message."""
-        return f"[INFO] {msg}"
-    
-    def get_help(self):
-        """Return help text for add command."""
-        return """
-Add a new series to track.
+    def bulk_execute(self, args_list):
+        """
+        Add many series at once, inserting them in batched transactions.
 
-Usage:
-  add <name> [score]              Auto-lookup IMDB ID by series name
-  add <name> <imdb_id> [score]    With explicit IMDB ID
+        Every row is validated before anything is written. Rows with an
+        explicit IMDB ID are inserted together (ADD_BATCH_SIZE per
+        transaction); rows without one need an IMDB search, so they fall
+        back to the regular execute() flow.
 
-Arguments:
-  name              Series name (use quotes if it contains spaces)
-  imdb_id           IMDB ID (e.g., tt0903747) or full IMDB URL
-  score             Optional: Your rating (1-10, default: 5)
+        Args:
+            args_list: List of argument lists, one per series
+                       (same format as for execute)
 
-Examples:
-  add "Breaking Bad" 9                    # Auto-lookup
-  add "Breaking Bad" tt0903747 9          # With IMDB ID
-  add "The Office" 8                      # May show options if multiple matches
-  add "Stranger Things" tt4574334
-        """
\ No newline at end of file
+        Returns:
+            str: Summary of added, skipped and failed rows
+        """
+        with self.log_op("Add series batch", rows=len(args_list)) as op:
+            pending = []
+            lookups = []
+            errors = []
+            skipped = []
+            seen_ids = set()
+
+            try:
+                existing_ids = {s.imdb_id for s in self.db_manager.get_all_series()}
+                watch_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                # Validate every row before writing anything
+                for line_no, args in enumerate(args_list, 1):
+                    if not args:
+                        continue
+
+                    name = args[0]
+                    imdb_id = None
+                    score = 5
+                    if len(args) >= 2:
+                        second_arg = parse_identifier(args[1])
+                        if second_arg.is_imdb:
+                            imdb_id = second_arg
+                            if len(args) >= 3:
+                                score = args[2]
+                        elif second_arg.kind == 'score':
+                            score = args[1]
+                        else:
+                            errors.append(f"  Line {line_no}: use quotes around names with spaces")
+                            continue
+
+                    try:
+                        validated_name = validate_series_name(name)
+                        validated_score = validate_score(score)
+                        if imdb_id is None:
+                            lookups.append(args)
+                            continue
+                        validated_imdb_id = validate_imdb_link(imdb_id)
+                    except ValidationError as e:
+                        errors.append(f"  Line {line_no}: {e}")
+                        continue
+
+                    if validated_imdb_id in existing_ids or validated_imdb_id in seen_ids:
+                        skipped.append(f"  {validated_name} ({validated_imdb_id})")
+                        continue
+                    seen_ids.add(validated_imdb_id)
+
+                    pending.append(Series(
+                        name=validated_name,
+                        imdb_id=validated_imdb_id,
+                        score=validated_score,
+                        last_episode="S00E00",
+                        last_watch_date=watch_date,
+                        snoozed=0
+                    ))
+
+                # Insert in transactions of at most ADD_BATCH_SIZE rows
+                added = 0
+                for start in range(0, len(pending), ADD_BATCH_SIZE):
+                    chunk = pending[start:start + ADD_BATCH_SIZE]
+                    op.debug(f"Inserting batch of {len(chunk)} series...")
+                    added += self.db_manager.add_series_many(chunk)
+
+                # Rows without an IMDB ID go through the normal search flow
+                lookup_results = [self.execute(args) for args in lookups]
+
+                op.success(f"Batch added {added} series")
+
+            except Exception as e:
+                op.error(str(e))
+                return self.error_msg(f"Failed to add series batch: {e}")
+
+        lines = [self.success_msg(f"Added {added} series in batch mode")]
+        if skipped:
+            lines.append("")
+            lines.append(self.warning_msg(f"Skipped {len(skipped)} already tracked:"))
+            lines.extend(skipped)
+        if errors:
+            lines.append("")
+            lines.append(self.error_msg(f"{len(errors)} invalid line(s):"))
+            lines.extend(errors)
+        for result in lookup_results:
+            lines.append("")
+            lines.append(result)
+
+        return "\n".join(lines)
+
+    def get_help(self):
+        """Return help text for add command."""
+        return _HELP_TEXT
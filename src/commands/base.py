@@ -16,23 +16,56 @@ RESPONSABILITATI:
 """
 
 
-from abc import ABC, abstractmethod
+from typing import Callable
+
 from ..database.db_manager import DBManager
 from ..utils.logger import get_logger, log_operation, is_verbose
+from ..utils.validators import parse_identifier, validate_imdb_link, ValidationError
+
 
+def shared_service(db_manager: DBManager, key: str, factory: Callable[[DBManager], object]):
+    """
+    Return the service stored under `key` for a database manager,
+    creating it with factory(db_manager) on first use.
+    
+    Commands on the same database share one instance (and its scrapers
+    and caches). It is kept in the manager's shared_services, so it is
+    released together with the manager.
+    
+    Args:
+        db_manager: Database manager the service belongs to
+        key: Name of the service in shared_services
+        factory: Builds the service from the manager
+    
+    Returns:
+        The shared service
+    """
+    service = db_manager.shared_services.get(key)
+    if service is None:
+        service = factory(db_manager)
+        db_manager.shared_services[key] = service
+    return service
 
 
-class Command(ABC):
+class Command:
     """
     Abstract base class for all commands.
     Implements Command pattern for CLI operations.
     
+    A plain class rather than an ABC (no metaclass on every command):
+    subclasses must override execute() and get_help(), which raise
+    NotImplementedError otherwise.
+    
     Provides helper methods for:
     - Consistent output formatting (success, error, info messages)
     - Operation logging with context
     - Verbose mode awareness
     """
     
+    # Subclasses that add no state declare empty __slots__ so their
+    # instances stay dict-free
+    __slots__ = ('db_manager', '_verbose', '_logger')
+    
     def __init__(self, db_manager: DBManager):
         """
         Initialize command with database manager.
@@ -41,9 +74,16 @@ class Command(ABC):
             db_manager: Database manager instance
         """
         self.db_manager = db_manager
-        self.logger = get_logger()
+        self._verbose = is_verbose()
+        self._logger = None
+    
+    @property
+    def logger(self):
+        """Application logger, looked up on first use."""
+        if self._logger is None:
+            self._logger = get_logger()
+        return self._logger
     
-    @abstractmethod
     def execute(self, args: list) -> str:
         """
         Execute the command with given arguments.
@@ -54,9 +94,8 @@ class Command(ABC):
         Returns:
             str: Result message
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
     
-    @abstractmethod
     def get_help(self) -> str:
         """
         Get help text for this command.
@@ -64,7 +103,7 @@ class Command(ABC):
         Returns:
             str: Help text
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement get_help()")
     
     # ==========================================================================
     # Output Formatting Helpers
@@ -117,8 +156,12 @@ class Command(ABC):
     
     @property
     def verbose(self) -> bool:
-        """Check if verbose mode is enabled."""
-        return is_verbose()
+        """Check if verbose mode is enabled (cached, see refresh_verbosity)."""
+        return self._verbose
+    
+    def refresh_verbosity(self):
+        """Re-read the global verbose flag after it was changed."""
+        self._verbose = is_verbose()
     
     def debug(self, message: str):
         """Log a debug message (only visible in verbose mode)."""
@@ -146,11 +189,11 @@ class Command(ABC):
                 - If multiple matches: (None, formatted_options_string)
         """
         # Check if it looks like an IMDB ID
-        if identifier.lower().startswith('tt') or 'imdb.com' in identifier.lower():
+        ident = parse_identifier(identifier)
+        if ident.is_imdb:
             # Direct IMDB ID lookup
-            from ..utils.validators import validate_imdb_link, ValidationError
             try:
-                imdb_id = validate_imdb_link(identifier)
+                imdb_id = validate_imdb_link(ident)
                 series = self.db_manager.get_series(imdb_id)
                 if series:
                     return (series, None)
@@ -159,16 +202,13 @@ class Command(ABC):
             except ValidationError as e:
                 return (None, f"Invalid IMDB ID: {e}")
         
-        # Search by name in the database
-        all_series = self.db_manager.get_all_series()
-        
         # First try exact match (case-insensitive)
-        exact_matches = [s for s in all_series if s.name.lower() == identifier.lower()]
+        exact_matches = self.db_manager.find_by_name(identifier, exact=True)
         if len(exact_matches) == 1:
             return (exact_matches[0], None)
         
         # Then try partial match (name contains the search term)
-        partial_matches = [s for s in all_series if identifier.lower() in s.name.lower()]
+        partial_matches = self.db_manager.find_by_name(identifier)
         
         if len(partial_matches) == 0:
             return (None, f"No series found matching '{identifier}'.\nUse 'list' to see your tracked series.")
@@ -29,13 +29,55 @@ COMMAND OPTIONS:
 ================
 - check                Show new videos across all series
 - check --series ID    Check specific series only
+- check --jobs N       Check N series in parallel
 - check --stats        Show cache statistics
 - check --clear        Clear the video cache
 """
 
-from typing import Optional
-from .base import Command
-from ..services.notification_service import NotificationService
+import time
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterator, List, Optional
+from .base import Command, shared_service
+from ..config.settings import CHECK_MAX_WORKERS
+
+
+# Output separators, shared by every report
+_SEP_HEAVY = "═" * 60
+_SEP_LIGHT = "─" * 40
+
+# Whole 'check' report when nothing new was found (the usual case),
+# built once; only the timestamp line is added per run
+_EMPTY_REPORT = "\n".join([
+    _SEP_HEAVY,
+    "CHECKING FOR NEW VIDEOS...",
+    _SEP_HEAVY,
+    "",
+    "[OK] No new videos found since last check.",
+    "",
+    "Tip: Videos are cached after first discovery.",
+    "     Run 'check --clear' to reset the cache.",
+    "",
+    _SEP_HEAVY,
+])
+
+
+def _parse_options(args: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse command flags in a single pass over the arguments.
+    
+    Args:
+        args: Command arguments
+    
+    Returns:
+        dict: Each flag (first occurrence) mapped to the argument that
+              follows it, or None if it is the last argument
+    """
+    options: Dict[str, Optional[str]] = {}
+    last = len(args) - 1
+    for i, arg in enumerate(args):
+        if arg.startswith('-') and arg not in options:
+            options[arg] = args[i + 1] if i < last else None
+    return options
 
 
 class CheckCommand(Command):
@@ -49,12 +91,15 @@ class CheckCommand(Command):
     4. Display consolidated notifications
     """
     
-    def __init__(self, db_manager):
-        """Initialize with database manager."""
-        super().__init__(db_manager)
-        self.notification_service = NotificationService(db_manager)
+    __slots__ = ()
+    
+    @property
+    def notification_service(self):
+        """Notification service shared by all commands on this database."""
+        from ..services.notification_service import NotificationService
+        return shared_service(self.db_manager, 'notification_service', NotificationService)
     
-    def execute(self, args):
+    def execute(self, args: List[str]):
         """
         Execute the check command.
         
@@ -65,124 +110,140 @@ class CheckCommand(Command):
                 - --stats: Show cache statistics
                 - --clear: Clear video cache
                 - --min-score N: Only check series with score >= N
+                - --jobs N: Series checked in parallel
         
         Returns:
-            str: Notification output
+            str: Notification output, or an iterator of lines for the
+                 full check (streamed by the CLI)
         """
         try:
+            options = _parse_options(args)
+            
             # Handle special flags
-            if '--stats' in args:
+            if '--stats' in options:
                 return self._show_stats()
             
-            if '--clear' in args:
-                return self._clear_cache(args)
+            if '--clear' in options:
+                return self._clear_cache(options)
             
             # Parse options
-            series_id = self._parse_string_arg(args, '--series', '-s')
-            min_score = self._parse_int_arg(args, '--min-score', '-m')
+            series_id = self._string_option(options, '--series', '-s')
+            min_score = self._int_option(options, '--min-score', '-m')
+            jobs = self._int_option(options, '--jobs', '-j') or CHECK_MAX_WORKERS
             
             # Run appropriate check
             if series_id:
                 return self._check_series(series_id)
             else:
-                return self._check_all(min_score)
+                return self._check_all(min_score, max(1, jobs))
         
         except Exception as e:
             error_msg = f"Failed to check for new videos: {e}"
             self.logger.error(error_msg)
             return f"[ERROR] {error_msg}"
     
-    def _parse_string_arg(self, args, long_flag, short_flag) -> Optional[str]:
-        """Parse a string argument from command args."""
-        for flag in [long_flag, short_flag]:
-            if flag in args:
-                try:
-                    idx = args.index(flag)
-                    if idx + 1 < len(args):
-                        return args[idx + 1]
-                except (ValueError, IndexError):
-                    pass
+    def _string_option(
+        self, options: Dict[str, Optional[str]], long_flag: str, short_flag: str
+    ) -> Optional[str]:
+        """Get a string option parsed by _parse_options()."""
+        for flag in (long_flag, short_flag):
+            value = options.get(flag)
+            if value is not None:
+                return value
         return None
     
-    def _parse_int_arg(self, args, long_flag, short_flag) -> Optional[int]:
-        """Parse an integer argument from command args."""
-        for flag in [long_flag, short_flag]:
-            if flag in args:
-                try:
-                    idx = args.index(flag)
-                    if idx + 1 < len(args):
-                        return int(args[idx + 1])
-                except (ValueError, IndexError):
-                    pass
+    def _int_option(
+        self, options: Dict[str, Optional[str]], long_flag: str, short_flag: str
+    ) -> Optional[int]:
+        """Get an integer option parsed by _parse_options()."""
+        for flag in (long_flag, short_flag):
+            try:
+                return int(options[flag])
+            except (KeyError, ValueError, TypeError):
+                pass
         return None
     
-    def _check_all(self, min_score: Optional[int]) -> str:
+    def _check_all(self, min_score: Optional[int], jobs: int = 1) -> Iterator[str]:
         """
         Check all series for new videos.
         
+        The check itself runs here, so its errors surface in execute();
+        only the rendering is deferred.
+        
         Args:
             min_score: Minimum series score to check
+            jobs: Number of series checked in parallel
             
         Returns:
-            Formatted notification output
+            Iterator over the formatted notification lines
         """
-        lines = [
-            "═" * 60,
-            "CHECKING FOR NEW VIDEOS...",
-            "═" * 60,
-            ""
-        ]
-        
         # Run the check
         notifications = self.notification_service.check_all(
             min_score=min_score,
-            max_episodes_per_series=3  # Limit to avoid rate limiting
+            max_episodes_per_series=3,  # Limit to avoid rate limiting
+            max_workers=jobs
         )
+        return self._iter_check_all_lines(notifications)
+    
+    def _iter_check_all_lines(self, notifications: list) -> Iterator[str]:
+        """
+        Yield the 'check' report line by line.
         
+        Lines are streamed to the CLI instead of being joined into one
+        string, so a large report is never held in memory twice.
+        
+        Args:
+            notifications: Notifications returned by check_all()
+        
+        Yields:
+            Output lines
+        """
         if not notifications:
-            lines.append("[OK] No new videos found since last check.")
-            lines.append("")
-            lines.append("Tip: Videos are cached after first discovery.")
-            lines.append("     Run 'check --clear' to reset the cache.")
-        else:
-            # Count totals
-            total_new = sum(n.count for n in notifications)
-            lines.append(f"Found {total_new} new video(s)!\n")
-            
-            # Group by series for cleaner output
-            current_series = None
+            yield _EMPTY_REPORT
+            yield f"Checked at: {time.strftime('%Y-%m-%d %H:%M:%S')}"
+            return
+        
+        yield _SEP_HEAVY
+        yield "CHECKING FOR NEW VIDEOS..."
+        yield _SEP_HEAVY
+        yield ""
+        
+        # Group by series (first-seen order), so each header is
+        # emitted once even if notifications arrive interleaved
+        total_new: int = 0
+        by_series: DefaultDict[str, list] = defaultdict(list)
+        for notif in notifications:
+            total_new += notif.count
+            by_series[notif.series_name].append(notif)
+        
+        yield f"Found {total_new} new video(s)!\n"
+        
+        for i, (series_name, series_notifs) in enumerate(by_series.items()):
+            if i:
+                yield ""  # Blank between series
+            yield f"[{series_name}]"
+            yield _SEP_LIGHT
             
-            for notif in notifications:
-                # Add series header if new series
-                if notif.series_name != current_series:
-                    if current_series is not None:
-                        lines.append("")  # Blank between series
-                    lines.append(f"[{notif.series_name}]")
-                    lines.append("─" * 40)
-                    current_series = notif.series_name
-                
+            for notif in series_notifs:
                 # Show episode and its new videos
                 if notif.episode_code != 'general':
-                    lines.append(f"  {notif.episode_code}:")
+                    yield f"  {notif.episode_code}:"
                 else:
-                    lines.append("  General trailers:")
+                    yield "  General trailers:"
                 
                 for video in notif.new_videos:
                     # Truncate long titles
                     title = video.title
                     if len(title) > 45:
-                        title = title[:42] + "..."
-                    lines.append(f"    • {title}")
-                    lines.append(f"      {video.url}")
+                        title = f"{title[:42]}..."
+                    yield f"    • {title}"
+                    yield f"      {video.url}"
         
-        lines.append("")
-        lines.append("═" * 60)
+        yield ""
+        yield _SEP_HEAVY
         
         # Add timestamp
-        from datetime import datetime
-        lines.append(f"Checked at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        return "\n".join(lines)
+        yield f"Checked at: {time.strftime('%Y-%m-%d %H:%M:%S')}"
     
     def _check_series(self, imdb_id: str) -> str:
         """
@@ -200,9 +261,9 @@ class CheckCommand(Command):
             return f"[ERROR] Series with IMDB ID '{imdb_id}' not found.\n  Use 'add' command first."
         
         lines = [
-            "═" * 60,
+            _SEP_HEAVY,
             f"CHECKING: {series.name}",
-            "═" * 60,
+            _SEP_HEAVY,
             ""
         ]
         
@@ -211,21 +272,25 @@ class CheckCommand(Command):
         if not notifications:
             lines.append("[OK] No new videos found for this series.")
         else:
-            total_new = sum(n.count for n in notifications)
-            lines.append(f"Found {total_new} new video(s)!\n")
+            # Placeholder for the total, filled in after the single pass
+            count_idx = len(lines)
+            lines.append("")
+            total_new = 0
             
             for notif in notifications:
+                total_new += notif.count
                 if notif.episode_code != 'general':
                     lines.append(f"  {notif.episode_code}:")
                 else:
                     lines.append("  General trailers:")
                 
                 for video in notif.new_videos:
-                    lines.append(f"    • {video.title}")
-                    lines.append(f"      {video.url}")
+                    lines.extend((f"    • {video.title}", f"      {video.url}"))
                 lines.append("")
+            
+            lines[count_idx] = f"Found {total_new} new video(s)!\n"
         
-        lines.append("═" * 60)
+        lines.append(_SEP_HEAVY)
         return "\n".join(lines)
     
     def _show_stats(self) -> str:
@@ -233,23 +298,23 @@ class CheckCommand(Command):
         stats = self.notification_service.get_cache_stats()
         
         lines = [
-            "═" * 60,
+            _SEP_HEAVY,
             "VIDEO CACHE STATISTICS",
-            "═" * 60,
+            _SEP_HEAVY,
             "",
             f"  Cache entries: {stats['total_entries']}",
             f"  Total videos tracked: {stats['total_videos']}",
             f"  Cache file: {stats['cache_path']}",
             "",
-            "═" * 60
+            _SEP_HEAVY
         ]
         
         return "\n".join(lines)
     
-    def _clear_cache(self, args) -> str:
+    def _clear_cache(self, options: Dict[str, Optional[str]]) -> str:
         """Clear the video cache."""
         # Check if clearing specific series
-        series_id = self._parse_string_arg(args, '--series', '-s')
+        series_id = self._string_option(options, '--series', '-s')
         
         if series_id:
             series = self.db_manager.get_series(series_id)
@@ -274,6 +339,7 @@ Usage: check [options]
 Options:
   --series ID, -s ID    Check specific series only
   --min-score N, -m N   Only check series with score >= N
+  --jobs N, -j N        Series checked in parallel (default: 4)
   --stats               Show cache statistics
   --clear               Clear the video cache
 
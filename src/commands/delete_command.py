@@ -7,11 +7,14 @@ Phase 7 Enhancement: Name-based series lookup.
 """
 
 from .base import Command
+from ..utils.validators import parse_identifier
 
 
 class DeleteCommand(Command):
     """Command to delete a series from tracking."""
     
+    __slots__ = ()
+    
     def execute(self, args):
         """
         Delete a series from the database.
@@ -34,28 +37,38 @@ class DeleteCommand(Command):
                         "  delete tt0903747"
                     )
                 
-                # Resolve series by name or IMDB ID
                 identifier = args[0]
-                series, error = self.resolve_series(identifier)
-                if error:
-                    return self.error_msg(error)
-                
-                op.debug(f"Deleting: {series.name} ({series.imdb_id})")
-                
-                # Delete from database
-                deleted = self.db_manager.delete_series(series.imdb_id)
+                ident = parse_identifier(identifier)
                 
-                if deleted:
-                    op.success(f"Deleted '{series.name}'")
-                    return (
-                        self.success_msg("Successfully deleted series:") + "\n"
-                        f"  Name:     {series.name}\n"
-                        f"  IMDB ID:  {series.imdb_id}\n\n"
-                        "[INFO] The series has been removed from your tracking list."
-                    )
+                if ident.imdb_id:
+                    # Known IMDB ID: delete directly, the removed row comes back
+                    op.debug(f"Deleting: {ident.imdb_id}")
+                    series = self.db_manager.delete_series_returning(ident.imdb_id)
+                    if not series:
+                        return self.error_msg(
+                            f"Series with IMDB ID '{ident.imdb_id}' not found.\n"
+                            "Use 'list' to see your tracked series."
+                        )
                 else:
-                    op.error(f"Database error for {series.imdb_id}")
-                    return self.error_msg(f"Failed to delete series {series.imdb_id}")
+                    # Resolve series by name (or report an invalid IMDB ID)
+                    series, error = self.resolve_series(identifier)
+                    if error:
+                        return self.error_msg(error)
+                    
+                    op.debug(f"Deleting: {series.name} ({series.imdb_id})")
+                    
+                    # Delete from database
+                    if not self.db_manager.delete_series_returning(series.imdb_id):
+                        op.error(f"Database error for {series.imdb_id}")
+                        return self.error_msg(f"Failed to delete series {series.imdb_id}")
+                
+                op.success(f"Deleted '{series.name}'")
+                return (
+                    self.success_msg("Successfully deleted series:") + "\n"
+                    f"  Name:     {series.name}\n"
+                    f"  IMDB ID:  {series.imdb_id}\n\n"
+                    "[INFO] The series has been removed from your tracking list."
+                )
             
             except Exception as e:
                 op.error(str(e))
@@ -15,11 +15,106 @@ RESPONSABILITATI:
 """
 
 
-from typing import Optional, List
-from datetime import datetime
-from .base import Command
-from ..services.episode_ranker import EpisodeRanker, PrioritizedEpisode
-from ..utils.logger import log_operation, is_verbose
+import time
+from typing import Optional, List, TYPE_CHECKING
+from .base import Command, shared_service
+from ..utils.logger import log_operation
+
+if TYPE_CHECKING:
+    from ..services.episode_ranker import EpisodeRanker, PrioritizedEpisode
+
+
+# Separatoare si antet comune, construite o singura data
+_SEP_HEAVY = "═" * 60
+_SEP_LIGHT = "─" * 60
+_HEADER = (_SEP_HEAVY, "NEW EPISODES", _SEP_HEAVY, "")
+
+# Flag-uri booleene si flag-uri cu valoare intreaga, mapate pe numele optiunii
+_BOOL_FLAGS = {
+    '--all': 'all', '-a': 'all',
+    '--verbose': 'verbose', '-v': 'verbose',
+    '--debug': 'debug', '-d': 'debug',
+    '--refresh': 'refresh', '-r': 'refresh',
+}
+_INT_FLAGS = {
+    '--min-score': 'min_score', '-m': 'min_score',
+    '--top': 'top', '-t': 'top',
+}
+
+
+def _parse_args(args: list) -> dict:
+    """
+    Parse episodes command arguments in a single pass.
+    
+    Boolean flags map to True, integer flags consume the next token
+    unless it is another flag (None if it is missing or not a number)
+    and the first non-flag token is taken as the series filter.
+    
+    Args:
+        args: Command arguments
+    
+    Returns:
+        dict: Keys 'all', 'verbose', 'debug', 'refresh', 'min_score', 'top',
+              'series_filter'
+    """
+    parsed = {
+        'all': False, 'verbose': False, 'debug': False, 'refresh': False,
+        'min_score': None, 'top': None, 'series_filter': None,
+    }
+    last = len(args) - 1
+    skip_next = False
+    for i, arg in enumerate(args):
+        if skip_next:
+            skip_next = False
+        elif arg in _BOOL_FLAGS:
+            parsed[_BOOL_FLAGS[arg]] = True
+        elif arg in _INT_FLAGS:
+            # A following flag is not a value: leave it to the next pass
+            value = args[i + 1] if i < last else None
+            if value is None or value.startswith('-'):
+                continue
+            skip_next = True
+            key = _INT_FLAGS[arg]
+            if parsed[key] is None:
+                try:
+                    parsed[key] = int(value)
+                except ValueError:
+                    pass
+        elif parsed['series_filter'] is None and not arg.startswith('-'):
+            parsed['series_filter'] = arg
+    return parsed
+
+
+def _episode_line(number: int, ep: 'PrioritizedEpisode') -> str:
+    """Format one numbered episode line (title omitted when unknown)."""
+    title = ep.episode_title
+    if title and title != "Unknown":
+        return f"   {number:3}. {ep.episode_code} - {title}"
+    return f"   {number:3}. {ep.episode_code}"
+
+
+# Help text, built once at import
+_HELP = (
+    "List new episodes across tracked series.\n\n"
+    "Usage:\n"
+    "  episodes                    Show all new episodes\n"
+    '  episodes "Dark"             Show only Dark episodes\n'
+    '  episodes "Game" --top 5     First 5 Game of Thrones episodes\n\n'
+    "Arguments:\n"
+    "  series_name             Optional: Filter by series name (partial match)\n\n"
+    "Options:\n"
+    "  --all, -a               Include snoozed series\n"
+    "  --min-score N, -m N     Only series with score >= N\n"
+    "  --top N, -t N           Limit to top N episodes\n"
+    "  --verbose, -v           Show IMDB IDs and air dates\n"
+    "  --debug, -d             Show fetching progress\n"
+    "  --refresh, -r           Re-check IMDB instead of using the cached list\n\n"
+    "Examples:\n"
+    "  episodes                    All new episodes\n"
+    '  episodes "Dark"             Only Dark series\n'
+    "  episodes --min-score 8      Only 8+ rated series\n"
+    '  episodes "Game" --top 10    Top 10 GoT episodes\n'
+)
 
 
 class EpisodesCommand(Command):
@@ -33,7 +128,15 @@ class EpisodesCommand(Command):
     def __init__(self, db_manager):
         """Initialize with database manager."""
         super().__init__(db_manager)
-        self.ranker = EpisodeRanker(db_manager)
+        self._ranker = None
+    
+    @property
+    def ranker(self) -> 'EpisodeRanker':
+        """Episode ranker shared with the other commands, fetched on first use."""
+        if self._ranker is None:
+            from ..services.episode_ranker import EpisodeRanker
+            self._ranker = shared_service(self.db_manager, 'episode_ranker', EpisodeRanker)
+        return self._ranker
     
     def execute(self, args: list) -> str:
         """
@@ -45,49 +148,48 @@ class EpisodesCommand(Command):
                 - --min-score N, -m N: Minimum series score
                 - --top N, -t N: Limit results
                 - --verbose, -v: Show detailed information
+                - --refresh, -r: Ignore the cached watchlist
         
         Returns:
             str: Formatted list of new episodes
         """
         with log_operation("Listing episodes", args=args) as op:
             try:
-                # Parse arguments
-                include_snoozed = '--all' in args or '-a' in args
-                verbose = '--verbose' in args or '-v' in args
-                debug_mode = '--debug' in args or '-d' in args
-                min_score = self._parse_int_arg(args, '--min-score', '-m')
-                top_n = self._parse_int_arg(args, '--top', '-t')
+                # Parse arguments (o singura trecere prin args)
+                parsed = _parse_args(args)
+                include_snoozed = parsed['all']
+                verbose = parsed['verbose']
+                debug_mode = parsed['debug']
+                min_score = parsed['min_score']
+                top_n = parsed['top']
                 
-                # Detecteaza filtru dupa nume serie (primul argument care nu e flag)
-                series_filter = self._parse_series_filter(args)
+                # Filtru dupa nume serie (primul argument care nu e flag)
+                series_filter = parsed['series_filter']
                 
                 # Enable verbose logging if debug mode
                 if debug_mode:
                     from ..utils.logger import set_verbose
                     set_verbose(True)
                 
-                # Get episodes from ranker
+                # Get episodes from ranker (filtrele se aplica in query-ul de serii)
                 op.debug("Fetching prioritized watchlist...")
                 episodes = self.ranker.get_prioritized_watchlist(
                     include_snoozed=include_snoozed,
                     min_score=min_score,
-                    max_results=None  # Aplica limita dupa filtrare
+                    max_results=top_n or None,
+                    series_like=series_filter,
+                    use_cache=True,
+                    refresh_cache=parsed['refresh']
                 )
                 
-                # Filtreaza dupa serie daca e specificat
-                if series_filter:
-                    episodes = [
-                        ep for ep in episodes 
-                        if series_filter.lower() in ep.series_name.lower()
-                    ]
-                    op.debug(f"Filtered to series matching '{series_filter}': {len(episodes)} episodes")
-                
-                # Aplica limita top_n dupa filtrare
-                if top_n and episodes:
-                    episodes = episodes[:top_n]
+                # Numara seriile snoozed o singura data, doar daca hint-ul
+                # "snoozed series hidden" poate aparea (fara --all)
+                snoozed_count = 0 if include_snoozed else self.db_manager.count_snoozed()
                 
                 if not episodes:
-                    return self._format_no_episodes(include_snoozed, min_score, series_filter)
+                    return self._format_no_episodes(
+                        include_snoozed, min_score, series_filter, snoozed_count
+                    )
                 
                 # Format output
                 result = self._format_episodes(
@@ -96,7 +198,8 @@ class EpisodesCommand(Command):
                     min_score, 
                     top_n,
                     verbose,
-                    series_filter
+                    series_filter,
+                    snoozed_count
                 )
                 
                 op.success(f"Found {len(episodes)} new episode(s)")
@@ -106,51 +209,17 @@ class EpisodesCommand(Command):
                 op.error(str(e))
                 return f"[ERROR] Failed to list episodes: {e}"
     
-    def _parse_int_arg(self, args: list, long_flag: str, short_flag: str) -> Optional[int]:
-        """Parse an integer argument from command args."""
-        for flag in [long_flag, short_flag]:
-            if flag in args:
-                try:
-                    idx = args.index(flag)
-                    if idx + 1 < len(args):
-                        return int(args[idx + 1])
-                except (ValueError, IndexError):
-                    pass
-        return None
-    
-    def _parse_series_filter(self, args: list) -> Optional[str]:
-        """Extrage numele seriei din argumente (primul arg care nu e flag)."""
-        flags = ['--all', '-a', '--verbose', '-v', '--debug', '-d', 
-                 '--min-score', '-m', '--top', '-t']
-        skip_next = False
-        
-        for arg in args:
-            if skip_next:
-                skip_next = False
-                continue
-            if arg in ['--min-score', '-m', '--top', '-t']:
-                skip_next = True
-                continue
-            if arg not in flags and not arg.startswith('-'):
-                return arg
-        return None
-    
-    def _format_no_episodes(self, include_snoozed: bool, min_score: Optional[int], series_filter: Optional[str] = None) -> str:
+    def _format_no_episodes(self, include_snoozed: bool, min_score: Optional[int], series_filter: Optional[str] = None, snoozed_count: int = 0) -> str:
         """Format message when no episodes are found."""
         lines = [
-            "═" * 60,
-            "NEW EPISODES",
-            "═" * 60,
-            "",
+            *_HEADER,
             "[OK] You're all caught up! No new episodes found.",
             ""
         ]
         
         # Add helpful hints
-        if not include_snoozed:
-            snoozed_count = len([s for s in self.db_manager.get_all_series(True) if s.snoozed])
-            if snoozed_count > 0:
-                lines.append(f"[INFO] {snoozed_count} snoozed series hidden. Use '--all' to include them.")
+        if not include_snoozed and snoozed_count > 0:
+            lines.append(f"[INFO] {snoozed_count} snoozed series hidden. Use '--all' to include them.")
         
         if min_score:
             lines.append(f"[INFO] Filtering for score >= {min_score}. Try a lower score or remove filter.")
@@ -160,18 +229,19 @@ class EpisodesCommand(Command):
         
         lines.append("")
         lines.append("Tip: Use 'add' command to track more series.")
-        lines.append("═" * 60)
+        lines.append(_SEP_HEAVY)
         
         return "\n".join(lines)
     
     def _format_episodes(
         self,
-        episodes: List[PrioritizedEpisode],
+        episodes: List['PrioritizedEpisode'],
         include_snoozed: bool,
         min_score: Optional[int],
         top_n: Optional[int],
         verbose: bool,
-        series_filter: Optional[str] = None
+        series_filter: Optional[str] = None,
+        snoozed_count: int = 0
     ) -> str:
         """
         Format the list of episodes for display.
@@ -182,21 +252,29 @@ class EpisodesCommand(Command):
             min_score: Minimum score filter applied
             top_n: Limit applied
             verbose: Whether to show detailed information
+            series_filter: Series name filter applied
+            snoozed_count: Number of snoozed series (hidden unless --all)
         
         Returns:
             Formatted episode list string
         """
-        lines = [
-            "═" * 60,
-            "NEW EPISODES",
-            "═" * 60,
-            ""
-        ]
+        lines = list(_HEADER)
+        
+        # Group episodes by series for cleaner output (single pass)
+        series_episodes = {}
+        for ep in episodes:
+            bucket = series_episodes.get(ep.series_name)
+            if bucket is None:
+                bucket = series_episodes[ep.series_name] = {
+                    'score': ep.score,
+                    'imdb_id': ep.series_imdb_id,
+                    'episodes': []
+                }
+            bucket['episodes'].append(ep)
         
         # Summary line
         total = len(episodes)
-        series_set = {ep.series_name for ep in episodes}
-        lines.append(f"Found {total} new episode(s) across {len(series_set)} series")
+        lines.append(f"Found {total} new episode(s) across {len(series_episodes)} series")
         
         # Show active filters
         filters = []
@@ -213,85 +291,47 @@ class EpisodesCommand(Command):
             lines.append(f"Filters: {', '.join(filters)}")
         
         lines.append("")
-        lines.append("─" * 60)
+        lines.append(_SEP_LIGHT)
         lines.append("")
         
-        # Group episodes by series for cleaner output
-        series_episodes = {}
-        for ep in episodes:
-            if ep.series_name not in series_episodes:
-                series_episodes[ep.series_name] = {
-                    'score': ep.score,
-                    'imdb_id': ep.series_imdb_id,
-                    'episodes': []
-                }
-            series_episodes[ep.series_name]['episodes'].append(ep)
-        
-        # Sort series by score (highest first)
-        sorted_series = sorted(
-            series_episodes.items(), 
-            key=lambda x: -x[1]['score']
-        )
-        
-        # Display each series
+        # Display each series. The ranker returns episodes sorted by score
+        # (highest first), so first-seen series order is already by score
         episode_counter = 1
-        for series_name, data in sorted_series:
+        for series_name, data in series_episodes.items():
             lines.append(f"[{series_name}] Score: {data['score']}/10")
             if verbose:
                 lines.append(f"   IMDB: {data['imdb_id']}")
             
-            for ep in data['episodes']:
-                episode_line = f"   {episode_counter:3}. {ep.episode_code}"
-                
-                if ep.episode_title and ep.episode_title != "Unknown":
-                    episode_line += f" - {ep.episode_title}"
-                
-                lines.append(episode_line)
-                
-                # Additional details in verbose mode
-                if verbose and ep.air_date:
-                    lines.append(f"        Aired: {ep.air_date}")
-                
-                episode_counter += 1
+            # The verbose check is made once per series, not per episode
+            series_eps = data['episodes']
+            if verbose:
+                for number, ep in enumerate(series_eps, episode_counter):
+                    lines.append(_episode_line(number, ep))
+                    # Additional details in verbose mode
+                    if ep.air_date:
+                        lines.append(f"        Aired: {ep.air_date}")
+            else:
+                lines.extend(
+                    _episode_line(number, ep)
+                    for number, ep in enumerate(series_eps, episode_counter)
+                )
+            episode_counter += len(series_eps)
             
             lines.append("")  # Blank line between series
         
         lines.append("")
-        lines.append("─" * 60)
+        lines.append(_SEP_LIGHT)
         
         # Footer
         lines.append("")
-        if not include_snoozed:
-            snoozed_count = len([s for s in self.db_manager.get_all_series(True) if s.snoozed])
-            if snoozed_count > 0:
-                lines.append(f"[INFO] {snoozed_count} snoozed series hidden. Use '--all' to show all.")
+        if not include_snoozed and snoozed_count > 0:
+            lines.append(f"[INFO] {snoozed_count} snoozed series hidden. Use '--all' to show all.")
         
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("═" * 60)
+        lines.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(_SEP_HEAVY)
         
         return "\n".join(lines)
     
     def get_help(self) -> str:
         """Return help text for episodes command."""
-        help_text = (
-            "List new episodes across tracked series.\n\n"
-            "Usage:\n"
-            "  episodes                    Show all new episodes\n"
-            '  episodes "Dark"             Show only Dark episodes\n'
-            '  episodes "Game" --top 5     First 5 Game of Thrones episodes\n\n'
-            "Arguments:\n"
-            "  series_name             Optional: Filter by series name (partial match)\n\n"
-            "Options:\n"
-            "  --all, -a               Include snoozed series\n"
-            "  --min-score N, -m N     Only series with score >= N\n"
-            "  --top N, -t N           Limit to top N episodes\n"
-            "  --verbose, -v           Show IMDB IDs and air dates\n"
-            "  --debug, -d             Show fetching progress\n\n"
-            "Examples:\n"
-            "  episodes                    All new episodes\n"
-            '  episodes "Dark"             Only Dark series\n'
-            "  episodes --min-score 8      Only 8+ rated series\n"
-            '  episodes "Game" --top 10    Top 10 GoT episodes\n'
-        )
-        return help_text
-
+        return _HELP
@@ -3,18 +3,36 @@ List command implementation.
 Displays series and their new episodes.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .base import Command
-from ..scrapers.imdb_scraper import IMDBScraper
+from ..config.settings import WATCHLIST_MAX_WORKERS
+
+
+# Separator for the series table, built once
+_SEP = "=" * 70
+
+# Help text, built once at import
+_HELP = """
+List all tracked series and optionally check for new episodes.
+
+Usage: list [options]
+
+Options:
+  --check-episodes, -e    Check IMDB for new episodes
+  --all, -a               Include snoozed series
+
+Examples:
+  list                    Show all active series
+  list -e                 Show series and check for new episodes
+  list --all              Show all series including snoozed
+  list -e -a              Check episodes for all series
+        """
 
 
 class ListCommand(Command):
     """Command to list series and check for new episodes."""
     
-    def __init__(self, db_manager):
-        """Initialize with database manager and scraper."""
-        super().__init__(db_manager)
-        self.scraper = IMDBScraper()
-    
     def execute(self, args):
         """
         List all series or check for new episodes.
@@ -37,10 +55,18 @@ class ListCommand(Command):
                 return "No series found in database. Use 'add' command to add series."
             
             # Build output
-            output_lines = []
-            output_lines.append("=" * 70)
-            output_lines.append(f"YOUR TV SERIES ({len(series_list)} total)")
-            output_lines.append("=" * 70)
+            output_lines = [
+                _SEP,
+                f"YOUR TV SERIES ({len(series_list)} total)",
+                _SEP,
+            ]
+            
+            # Episoadele noi se cer de la IMDB in paralel, inainte de afisare;
+            # scraper-ul (si stiva HTTP) se incarca doar pentru --check-episodes
+            if check_episodes:
+                episode_results = self._fetch_new_episodes(
+                    [s for s in series_list if not s.snoozed]
+                )
             
             for idx, series in enumerate(series_list, 1):
                 output_lines.append(f"\n{idx}. {series.name}")
@@ -53,35 +79,28 @@ class ListCommand(Command):
                 # Check for new episodes if requested
                 if check_episodes and not series.snoozed:
                     output_lines.append("   Checking for new episodes...")
-                    try:
-                        new_episodes = self.scraper.get_new_episodes(
-                            series.imdb_id,
-                            series.last_episode
-                        )
-                        
-                        if new_episodes:
-                            output_lines.append(f"   [+] {len(new_episodes)} new episode(s) available!")
-                            # Show first 3 new episodes
-                            for ep in new_episodes[:3]:
-                                output_lines.append(f"      • {ep}")
-                            if len(new_episodes) > 3:
-                                output_lines.append(f"      ... and {len(new_episodes) - 3} more")
-                        else:
-                            output_lines.append("   [*] No new episodes")
-                    
-                    except Exception as e:
-                        output_lines.append(f"   [ERROR] Error checking episodes: {e}")
-                        self.logger.error(f"Error checking {series.imdb_id}: {e}")
+                    new_episodes, error = episode_results[series.imdb_id]
+                    if error is not None:
+                        output_lines.append(f"   [ERROR] Error checking episodes: {error}")
+                        self.logger.error(f"Error checking {series.imdb_id}: {error}")
+                    elif new_episodes:
+                        output_lines.append(f"   [+] {len(new_episodes)} new episode(s) available!")
+                        # Show first 3 new episodes
+                        for ep in new_episodes[:3]:
+                            output_lines.append(f"      • {ep}")
+                        if len(new_episodes) > 3:
+                            output_lines.append(f"      ... and {len(new_episodes) - 3} more")
+                    else:
+                        output_lines.append("   [*] No new episodes")
             
-            output_lines.append("\n" + "=" * 70)
+            output_lines.append(f"\n{_SEP}")
             
             if not check_episodes:
                 output_lines.append("Tip: Use '--check-episodes' or '-e' to check for new episodes")
             
-            if not include_snoozed:
-                snoozed_count = len([s for s in self.db_manager.get_all_series(True) if s.snoozed])
-                if snoozed_count > 0:
-                    output_lines.append(f"Note: {snoozed_count} snoozed series hidden. Use '--all' or '-a' to show all")
+            snoozed_count = 0 if include_snoozed else self.db_manager.count_snoozed()
+            if snoozed_count > 0:
+                output_lines.append(f"Note: {snoozed_count} snoozed series hidden. Use '--all' or '-a' to show all")
             
             return "\n".join(output_lines)
         
@@ -90,20 +109,34 @@ class ListCommand(Command):
             self.logger.error(error_msg)
             return f"[ERROR] {error_msg}"
     
+    def _fetch_new_episodes(self, series_list):
+        """
+        Get new episodes for several series, fetching them in parallel.
+        
+        Args:
+            series_list: Series to check
+        
+        Returns:
+            dict: imdb_id -> (new_episodes, error); error is None on success
+        """
+        from ..scrapers.imdb_scraper import IMDBScraper
+        scraper = IMDBScraper()
+        
+        def fetch(series):
+            try:
+                return scraper.get_new_episodes(series.imdb_id, series.last_episode), None
+            except Exception as e:
+                return [], e
+        
+        if len(series_list) > 1:
+            # Same IMDB lookups as the ranker, so the same worker count
+            with ThreadPoolExecutor(max_workers=WATCHLIST_MAX_WORKERS) as pool:
+                results = list(pool.map(fetch, series_list))
+        else:
+            results = [fetch(series) for series in series_list]
+        
+        return {series.imdb_id: result for series, result in zip(series_list, results)}
+    
     def get_help(self):
         """Return help text for list command."""
-        return """
-List all tracked series and optionally check for new episodes.
-
-Usage: list [options]
-
-Options:
-  --check-episodes, -e    Check IMDB for new episodes
-  --all, -a               Include snoozed series
-
-Examples:
-  list                    Show all active series
-  list -e                 Show series and check for new episodes
-  list --all              Show all series including snoozed
-  list -e -a              Check episodes for all series
-        """
\ No newline at end of file
+        return _HELP
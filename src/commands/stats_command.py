@@ -15,13 +15,44 @@ RESPONSABILITATI:
 """
 
 
-from datetime import datetime
-from typing import Optional
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
 
 from .base import Command
 from ..services.video_cache import VideoCache
 
 
+# Section divider, shared by every section
+_SEP_LIGHT = "─" * 40
+
+# Entries shown in the --cache breakdown
+_BREAKDOWN_LIMIT = 10
+
+# Status markers for the --series listing
+_SNOOZED_STATUS = "[Z]"
+_ACTIVE_STATUS = "[*]"
+
+# Closing section, identical on every run
+_QUICK_ACTIONS = (
+    "QUICK ACTIONS",
+    _SEP_LIGHT,
+    "  • Run 'check' to scan for new trailers",
+    "  • Run 'episodes' to see what's new",
+    "  • Run 'stats --cache' for cache details",
+)
+
+# 'Time ago' units: (upper bound in seconds, seconds per unit, singular,
+# plural), scanned in order; below a minute is "just now"
+_MINUTE = 60
+_TIME_AGO_UNITS = (
+    (3600, _MINUTE, "minute", "minutes"),
+    (86400, 3600, "hour", "hours"),
+    (float('inf'), 86400, "day", "days"),
+)
+
+
 class StatsCommand(Command):
     """
     Command to display dashboard statistics.
@@ -45,7 +76,8 @@ class StatsCommand(Command):
                 --series: Show series breakdown
                 
         Returns:
-            str: Formatted statistics output
+            str: Formatted statistics output, or an iterator of lines
+                 with --series (streamed by the CLI)
         """
         show_cache = '--cache' in args or '-c' in args
         show_series = '--series' in args or '-s' in args
@@ -55,118 +87,183 @@ class StatsCommand(Command):
             ""
         ]
         
-        # Series Statistics
-        all_series = self.db_manager.get_all_series(include_snoozed=True)
-        active_series = [s for s in all_series if not s.snoozed]
-        snoozed_series = [s for s in all_series if s.snoozed]
+        # Series Statistics (counts, average and top 3 computed in SQL)
+        series_stats = self.db_manager.get_series_stats(top_n=3)
+        total = series_stats['total']
+        snoozed_count = series_stats['snoozed']
         
         lines.append("SERIES")
-        lines.append(self.divider(40))
-        lines.append(f"  Total tracked:    {len(all_series)}")
-        lines.append(f"  Active:           {len(active_series)}")
-        lines.append(f"  Snoozed:          {len(snoozed_series)}")
+        lines.append(_SEP_LIGHT)
+        lines.append(f"  Total tracked:    {total}")
+        lines.append(f"  Active:           {total - snoozed_count}")
+        lines.append(f"  Snoozed:          {snoozed_count}")
         lines.append("")
         
         # Score Distribution
-        if all_series:
-            avg_score = sum(s.score for s in all_series) / len(all_series)
-            top_rated = sorted(all_series, key=lambda s: s.score, reverse=True)[:3]
+        if total:
+            avg_score = series_stats['avg_score']
+            top_rated = series_stats['top_rated']
             
             lines.append(f"  Average score:    {avg_score:.1f}/10")
             lines.append("")
             lines.append("  Top Rated:")
-            for i, series in enumerate(top_rated, 1):
-                snoozed = " [SNOOZED]" if series.snoozed else ""
-                lines.append(f"     {i}. {series.name} ({series.score}/10){snoozed}")
+            lines.extend([
+                f"     {i}. {series.name} ({series.score}/10)"
+                f"{' [SNOOZED]' if series.snoozed else ''}"
+                for i, series in enumerate(top_rated, 1)
+            ])
             lines.append("")
         
         # Cache Statistics
-        cache_stats = self.video_cache.get_stats()
+        # One pass over the entries gives the totals, the most recent check
+        # and the stale count (entries not checked in the last 7 days)
+        cache_entries = self.video_cache.get_all_entries()
+        total_entries = len(cache_entries)
+        total_videos = 0
+        checked_at = {}  # key -> parsed last_checked, reused by the breakdown
+        most_recent = None
+        stale_count = 0
+        now = datetime.now()  # One clock read for the whole report
+        stale_cutoff = now - timedelta(days=7)
+        for key, entry in cache_entries.items():
+            total_videos += len(entry.get('video_ids', ()))
+            try:
+                checked = datetime.fromisoformat(entry['last_checked'])
+            except (KeyError, ValueError, TypeError):
+                stale_count += 1  # Never checked counts as stale
+                continue
+            checked_at[key] = checked
+            if most_recent is None or checked > most_recent:
+                most_recent = checked
+            if checked < stale_cutoff:
+                stale_count += 1
         
         lines.append("VIDEO CACHE")
-        lines.append(self.divider(40))
-        lines.append(f"  Entries tracked:  {cache_stats['total_entries']}")
-        lines.append(f"  Videos found:     {cache_stats['total_videos']}")
+        lines.append(_SEP_LIGHT)
+        lines.append(f"  Entries tracked:  {total_entries}")
+        lines.append(f"  Videos found:     {total_videos}")
         
-        # Get cache freshness info
-        cache_entries = self.video_cache.get_all_entries()
-        if cache_entries:
-            # Find most recent check
-            last_checks = []
-            for key, entry in cache_entries.items():
-                if 'last_checked' in entry:
-                    try:
-                        last_checks.append(datetime.fromisoformat(entry['last_checked']))
-                    except (ValueError, TypeError):
-                        pass
+        # Cache freshness info
+        if most_recent is not None:
+            age = self._format_time_ago(most_recent, now)
+            lines.append(f"  Last check:       {age}")
             
-            if last_checks:
-                most_recent = max(last_checks)
-                age = self._format_time_ago(most_recent)
-                lines.append(f"  Last check:       {age}")
-                
-                # Count stale entries (older than 7 days)
-                stale_count = self.video_cache.count_stale_entries(days=7)
-                if stale_count > 0:
-                    lines.append(f"  Stale entries:    {stale_count} (>7 days old)")
+            if stale_count > 0:
+                lines.append(f"  Stale entries:    {stale_count} (>7 days old)")
         
         lines.append("")
         
         # Detailed cache info if requested
         if show_cache and cache_entries:
             lines.append("  Cache Breakdown:")
-            for key, entry in sorted(cache_entries.items())[:10]:
+            # Only the first few keys are shown; pick them without
+            # sorting the whole cache
+            first_entries = heapq.nsmallest(
+                _BREAKDOWN_LIMIT, cache_entries.items(), key=lambda item: item[0]
+            )
+            for key, entry in first_entries:
                 video_count = len(entry.get('video_ids', []))
-                last_check = entry.get('last_checked', 'unknown')
-                if last_check != 'unknown':
-                    try:
-                        dt = datetime.fromisoformat(last_check)
-                        last_check = self._format_time_ago(dt)
-                    except (ValueError, TypeError):
-                        pass
+                if key in checked_at:
+                    last_check = self._format_time_ago(checked_at[key], now)
+                else:
+                    last_check = entry.get('last_checked', 'unknown')
                 lines.append(f"     • {key}: {video_count} videos ({last_check})")
             
-            if len(cache_entries) > 10:
-                lines.append(f"     ... and {len(cache_entries) - 10} more")
+            remainder = total_entries - _BREAKDOWN_LIMIT
+            if remainder > 0:
+                lines.append(f"     ... and {remainder} more")
             lines.append("")
         
-        # Series breakdown if requested
-        if show_series and all_series:
-            lines.append("ALL SERIES")
-            lines.append(self.divider(40))
-            for series in sorted(all_series, key=lambda s: s.score, reverse=True):
-                status = "[Z]" if series.snoozed else "[*]"
-                lines.append(f"  {status} {series.name}")
-                lines.append(f"     Score: {series.score}/10 | Last: {series.last_episode}")
-            lines.append("")
+        # Cache health (counters cover this process only, so they fill up
+        # in interactive mode)
+        if show_cache:
+            lines.extend(self._cache_health_lines())
+        
+        if not show_series:
+            lines.extend(_QUICK_ACTIONS)
+            return "\n".join(lines)
+        
+        # Series breakdown (the only place full rows are needed). The query
+        # runs here so its errors surface in execute(); the listing can be
+        # long, so its lines are streamed instead of joined
+        all_series = self.db_manager.get_all_series(include_snoozed=True)
+        return itertools.chain(lines, self._iter_series_lines(all_series), _QUICK_ACTIONS)
+    
+    def _iter_series_lines(self, all_series: list) -> Iterator[str]:
+        """
+        Yield the ALL SERIES section line by line.
         
-        # Quick tips
-        lines.append("QUICK ACTIONS")
-        lines.append(self.divider(40))
-        lines.append("  • Run 'check' to scan for new trailers")
-        lines.append("  • Run 'episodes' to see what's new")
-        lines.append("  • Run 'stats --cache' for cache details")
+        Args:
+            all_series: Series rows, already ordered by score (highest first)
+        
+        Yields:
+            Output lines (nothing if there are no series)
+        """
+        if not all_series:
+            return
+        yield "ALL SERIES"
+        yield _SEP_LIGHT
+        for series in all_series:
+            yield f"  {_SNOOZED_STATUS if series.snoozed else _ACTIVE_STATUS} {series.name}"
+            yield f"     Score: {series.score}/10 | Last: {series.last_episode}"
+        yield ""
+    
+    def _cache_health_lines(self) -> list:
+        """
+        Build the CACHE HEALTH section: video cache lookups and the
+        in-memory YouTube search caches.
+        
+        Returns:
+            list: Section lines, ending with a blank line
+        """
+        from ..scrapers.youtube_scraper import YouTubeScraper
         
-        return "\n".join(lines)
+        obs = self.video_cache.get_observability()
+        ratio = obs['hit_ratio']
+        lines = [
+            "CACHE HEALTH (this session)",
+            _SEP_LIGHT,
+            f"  Video cache:      {obs['hits']} hits, {obs['misses']} misses"
+            f" ({f'{ratio:.0%}' if ratio is not None else 'n/a'} hit ratio)",
+            f"  Cache file size:  {obs['bytes'] / 1024:.1f} KB",
+        ]
+        
+        searches = (
+            ("Episode searches", YouTubeScraper.search_episode_videos),
+            ("Trailer searches", YouTubeScraper.search_series_trailers),
+        )
+        for label, search in searches:
+            info = search.cache_info()
+            lookups = info['hits'] + info['misses']
+            avg_miss = info['miss_seconds'] / info['misses'] if info['misses'] else 0.0
+            lines.append(
+                f"  {label + ':':<18}{info['hits']}/{lookups} hits, "
+                f"{info['size']}/{info['maxsize']} cached, "
+                f"{info['evictions']} evicted, {avg_miss:.2f}s avg miss"
+            )
+        
+        lines.append("")
+        return lines
     
-    def _format_time_ago(self, dt: datetime) -> str:
-        """Format a datetime as a human-readable 'time ago' string."""
-        now = datetime.now()
-        diff = now - dt
+    def _format_time_ago(self, dt: datetime, now: Optional[datetime] = None) -> str:
+        """
+        Format a datetime as a human-readable 'time ago' string.
         
-        seconds = diff.total_seconds()
+        Args:
+            dt: Moment to describe
+            now: Reference time (defaults to the current time); pass one
+                 value for a whole report so every line agrees
+        """
+        if now is None:
+            now = datetime.now()
+        seconds = (now - dt).total_seconds()
         
-        if seconds < 60:
+        if seconds < _MINUTE:
             return "just now"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        else:
-            days = int(seconds / 86400)
-            return f"{days} day{'s' if days != 1 else ''} ago"
+        for limit, unit_seconds, singular, plural in _TIME_AGO_UNITS:
+            if seconds < limit:
+                count = int(seconds // unit_seconds)
+                return f"{count} {singular if count == 1 else plural} ago"
     
     def get_help(self):
         """Return help text for stats command."""
@@ -175,13 +272,14 @@ Display BingeWatch statistics and dashboard.
 
 Usage:
   stats              Show general statistics
-  stats --cache      Include detailed cache breakdown  
+  stats --cache      Include cache breakdown and hit/miss counters
   stats --series     Include full series list
 
 Shows:
   • Series count (active/snoozed)
   • Average score and top-rated series
   • Video cache status and freshness
+  • Cache hit/miss counters for this session (with --cache)
   • Quick action suggestions
 
 Examples:
@@ -23,10 +23,104 @@ YouTube may rate-limit requests. If you get errors:
 - Results are cached where possible
 """
 
-from typing import Optional
-from .base import Command
-from ..scrapers.youtube_scraper import YouTubeScraper, VideoResult
-from ..services.episode_ranker import EpisodeRanker
+from typing import List, Sequence, Tuple, TYPE_CHECKING
+from .base import Command, shared_service
+
+if TYPE_CHECKING:
+    from ..scrapers.youtube_scraper import YouTubeScraper, VideoResult
+    from ..services.episode_ranker import EpisodeRanker
+
+
+def _parse_args(args: List[str]) -> Tuple[int, bool, List[str]]:
+    """
+    Parse trailers command arguments in a single pass.
+    
+    Args:
+        args: Command arguments
+    
+    Returns:
+        tuple: (count, show_next, positional). count defaults to 5 when
+               --count is missing or not a number; the value after
+               --count is never taken as a positional argument.
+    """
+    count = None
+    show_next = False
+    positional = []
+    it = iter(args)
+    for arg in it:
+        if arg in ('--count', '-c'):
+            value = next(it, None)
+            if count is None and value is not None:
+                try:
+                    count = int(value)
+                except ValueError:
+                    pass
+        elif arg in ('--next', '-n'):
+            show_next = True
+        elif not arg.startswith('-'):
+            positional.append(arg)
+    return count or 5, show_next, positional
+
+
+# Output separators, shared by every search
+_SEP_HEAVY = "═" * 60
+_SEP_LIGHT = "─" * 60
+
+
+def _video_block(number: int, video: 'VideoResult', show_duration: bool = True) -> str:
+    """
+    Format one numbered video result as a block of lines.
+    
+    Args:
+        number: Position in the result list
+        video: Video to format
+        show_duration: Whether to include the duration line
+    
+    Returns:
+        The video's lines joined with newlines
+    """
+    parts = [f"{number}. {video.title}"]
+    if video.channel_name != "Unknown":
+        parts.append(f"   Channel: {video.channel_name}")
+    if show_duration and video.duration:
+        parts.append(f"   Duration: {video.duration}")
+    parts.append(f"   🔗 {video.url}")
+    return "\n".join(parts)
+
+
+def _render_videos(
+    title: str,
+    videos: List['VideoResult'],
+    empty_lines: Sequence[str],
+    intro: Sequence[str] = (),
+    show_duration: bool = True
+) -> str:
+    """
+    Format a search result: header, optional intro, then the videos.
+    
+    Args:
+        title: Header title
+        videos: Videos found (may be empty)
+        empty_lines: Lines shown instead of the list when nothing was found
+        intro: Lines shown between the header and the results
+        show_duration: Whether to include each video's duration
+    
+    Returns:
+        Formatted results string
+    """
+    lines = [_SEP_HEAVY, title, _SEP_HEAVY, ""]
+    lines.extend(intro)
+    if not videos:
+        lines.extend(empty_lines)
+    else:
+        lines.append(f"Found {len(videos)} video(s):\n")
+        lines.append("\n\n".join([
+            _video_block(i, video, show_duration)
+            for i, video in enumerate(videos, 1)
+        ]))
+        lines.append("")
+    lines.append(_SEP_HEAVY)
+    return "\n".join(lines)
 
 
 class TrailersCommand(Command):
@@ -38,10 +132,26 @@ class TrailersCommand(Command):
     """
     
     def __init__(self, db_manager):
-        """Initialize with database manager and scrapers."""
+        """Initialize with database manager; scrapers are created on first use."""
         super().__init__(db_manager)
-        self.youtube_scraper = YouTubeScraper()
-        self.ranker = EpisodeRanker(db_manager)
+        self._youtube_scraper = None
+        self._ranker = None
+    
+    @property
+    def youtube_scraper(self) -> 'YouTubeScraper':
+        """YouTube scraper, imported and created on first use."""
+        if self._youtube_scraper is None:
+            from ..scrapers.youtube_scraper import YouTubeScraper
+            self._youtube_scraper = YouTubeScraper()
+        return self._youtube_scraper
+    
+    @property
+    def ranker(self) -> 'EpisodeRanker':
+        """Episode ranker shared with the other commands, fetched on first use."""
+        if self._ranker is None:
+            from ..services.episode_ranker import EpisodeRanker
+            self._ranker = shared_service(self.db_manager, 'episode_ranker', EpisodeRanker)
+        return self._ranker
     
     def execute(self, args):
         """
@@ -60,24 +170,8 @@ class TrailersCommand(Command):
             str: Formatted video results
         """
         try:
-            # Parse arguments
-            count = self._parse_int_arg(args, '--count', '-c') or 5
-            show_next = '--next' in args or '-n' in args
-            
-            # Filter out flags to get positional args
-            positional = [
-                a for a in args 
-                if not a.startswith('-') and a not in ['--next', '--count']
-            ]
-            
-            # Remove the number after --count from positional
-            if '--count' in args or '-c' in args:
-                try:
-                    idx = args.index('--count') if '--count' in args else args.index('-c')
-                    if idx + 1 < len(args):
-                        positional = [a for a in positional if a != args[idx + 1]]
-                except (ValueError, IndexError):
-                    pass
+            # Parse arguments (single pass)
+            count, show_next, positional = _parse_args(args)
             
             # Handle --next flag
             if show_next:
@@ -116,18 +210,6 @@ class TrailersCommand(Command):
             self.logger.error(error_msg)
             return f"[ERROR] {error_msg}"
     
-    def _parse_int_arg(self, args, long_flag, short_flag) -> Optional[int]:
-        """Parse an integer argument from command args."""
-        for flag in [long_flag, short_flag]:
-            if flag in args:
-                try:
-                    idx = args.index(flag)
-                    if idx + 1 < len(args):
-                        return int(args[idx + 1])
-                except (ValueError, IndexError):
-                    pass
-        return None
-    
     def _search_for_episode(self, series, episode_code: str, count: int) -> str:
         """
         Search for videos related to a specific episode.
@@ -140,14 +222,6 @@ class TrailersCommand(Command):
         Returns:
             Formatted results string
         """
-        
-        lines = [
-            "═" * 60,
-            f"TRAILERS: {series.name} {episode_code}",
-            "═" * 60,
-            ""
-        ]
-        
         # Search YouTube
         videos = self.youtube_scraper.search_episode_videos(
             series_name=series.name,
@@ -155,25 +229,16 @@ class TrailersCommand(Command):
             max_results=count
         )
         
-        if not videos:
-            lines.append("No videos found for this episode.")
-            lines.append("")
-            lines.append("Try searching for general series trailers:")
-            lines.append(f"  trailers {imdb_id}")
-        else:
-            lines.append(f"Found {len(videos)} video(s):\n")
-            
-            for i, video in enumerate(videos, 1):
-                lines.append(f"{i}. {video.title}")
-                if video.channel_name != "Unknown":
-                    lines.append(f"   Channel: {video.channel_name}")
-                if video.duration:
-                    lines.append(f"   Duration: {video.duration}")
-                lines.append(f"   🔗 {video.url}")
-                lines.append("")
-        
-        lines.append("═" * 60)
-        return "\n".join(lines)
+        return _render_videos(
+            f"TRAILERS: {series.name} {episode_code}",
+            videos,
+            empty_lines=[
+                "No videos found for this episode.",
+                "",
+                "Try searching for general series trailers:",
+                f"  trailers {series.imdb_id}",
+            ]
+        )
     
     def _search_for_series(self, series, count: int) -> str:
         """
@@ -186,36 +251,17 @@ class TrailersCommand(Command):
         Returns:
             Formatted results string
         """
-        
-        lines = [
-            "═" * 60,
-            f"TRAILERS: {series.name}",
-            "═" * 60,
-            ""
-        ]
-        
         # Search YouTube for general trailers
         videos = self.youtube_scraper.search_series_trailers(
             series_name=series.name,
             max_results=count
         )
         
-        if not videos:
-            lines.append("No trailers found for this series.")
-        else:
-            lines.append(f"Found {len(videos)} video(s):\n")
-            
-            for i, video in enumerate(videos, 1):
-                lines.append(f"{i}. {video.title}")
-                if video.channel_name != "Unknown":
-                    lines.append(f"   Channel: {video.channel_name}")
-                if video.duration:
-                    lines.append(f"   Duration: {video.duration}")
-                lines.append(f"   🔗 {video.url}")
-                lines.append("")
-        
-        lines.append("═" * 60)
-        return "\n".join(lines)
+        return _render_videos(
+            f"TRAILERS: {series.name}",
+            videos,
+            empty_lines=["No trailers found for this series."]
+        )
     
     def _search_for_next_episode(self, count: int) -> str:
         """
@@ -236,19 +282,6 @@ class TrailersCommand(Command):
         if not next_ep:
             return "[OK] All caught up! No episodes to find trailers for."
         
-        lines = [
-            "═" * 60,
-            f"TRAILERS FOR YOUR NEXT EPISODE",
-            "═" * 60,
-            "",
-            f"  Series: {next_ep.series_name}",
-            f"  Episode: {next_ep.episode_code}: {next_ep.episode_title}",
-            f"  Score: {next_ep.score}/10",
-            "",
-            "─" * 60,
-            ""
-        ]
-        
         # Search YouTube
         videos = self.youtube_scraper.search_episode_videos(
             series_name=next_ep.series_name,
@@ -257,20 +290,20 @@ class TrailersCommand(Command):
             max_results=count
         )
         
-        if not videos:
-            lines.append("No trailers found for this episode.")
-        else:
-            lines.append(f"Found {len(videos)} video(s):\n")
-            
-            for i, video in enumerate(videos, 1):
-                lines.append(f"{i}. {video.title}")
-                if video.channel_name != "Unknown":
-                    lines.append(f"   Channel: {video.channel_name}")
-                lines.append(f"   🔗 {video.url}")
-                lines.append("")
-        
-        lines.append("═" * 60)
-        return "\n".join(lines)
+        return _render_videos(
+            "TRAILERS FOR YOUR NEXT EPISODE",
+            videos,
+            empty_lines=["No trailers found for this episode."],
+            intro=[
+                f"  Series: {next_ep.series_name}",
+                f"  Episode: {next_ep.episode_code}: {next_ep.episode_title}",
+                f"  Score: {next_ep.score}/10",
+                "",
+                _SEP_LIGHT,
+                "",
+            ],
+            show_duration=False
+        )
     
     def get_help(self):
         """Return help text for trailers command."""
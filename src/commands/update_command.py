@@ -7,6 +7,8 @@ Phase 6 Enhancement: Detailed operation logging.
 
 from .base import Command
 from ..utils.validators import (
+    parse_identifier,
+    validate_imdb_link,
     validate_score,
     validate_episode_format,
     ValidationError
@@ -43,10 +45,24 @@ class UpdateCommand(Command):
                         "  update snooze tt0903747"
                     )
                 
-                action = args[0].lower()
+                action = self._action_name(args[0])
                 identifier = args[1]
                 
-                # Resolve series by name or IMDB ID
+                # Check the action and its value before touching the
+                # database, so bad input costs no lookup
+                handler = self._ACTIONS.get(action)
+                if handler is None:
+                    return (
+                        self.error_msg(f"Unknown action: {action}") + "\n\n"
+                        "Valid actions: score, snooze, unsnooze, episode"
+                    )
+                
+                value, error = self._parse_value(action, args)
+                if error:
+                    return error
+                
+                # Resolve series by name or IMDB ID (the only read; each
+                # handler then issues a single UPDATE)
                 series, error = self.resolve_series(identifier)
                 if error:
                     return self.error_msg(error)
@@ -54,19 +70,7 @@ class UpdateCommand(Command):
                 op.debug(f"Action: {action}, Series: {series.name} ({series.imdb_id})")
                 
                 # Route to appropriate action handler
-                if action == "score":
-                    return self._update_score(series, args, op)
-                elif action == "snooze":
-                    return self._snooze_series(series, op)
-                elif action == "unsnooze":
-                    return self._unsnooze_series(series, op)
-                elif action == "episode":
-                    return self._update_episode(series, args, op)
-                else:
-                    return (
-                        self.error_msg(f"Unknown action: {action}") + "\n\n"
-                        "Valid actions: score, snooze, unsnooze, episode"
-                    )
+                return handler(self, series, value, op)
             
             except ValidationError as e:
                 op.error(str(e))
@@ -80,15 +84,141 @@ class UpdateCommand(Command):
                 op.error(str(e))
                 return self.error_msg(f"Failed to update series: {e}")
     
-    def _update_score(self, series, args, op):
-        """Update series score."""
-        if len(args) < 3:
-            return (
-                self.error_msg("Missing score value") + "\n\n"
-                "Usage: update score <imdb_id> <1-10>"
-            )
+    @classmethod
+    def _action_name(cls, raw):
+        """
+        Normalize an action argument.
+        
+        Action names are ASCII, so lower() is enough; it only runs when
+        the argument is not already an exact (lowercase) action name.
+        """
+        return raw if raw in cls._ACTIONS else raw.lower()
+    
+    def _parse_value(self, action, args):
+        """
+        Validate and normalize the value argument of an action.
         
-        new_score = validate_score(args[2])
+        Args:
+            action: Known action name
+            args: Full argument list ([action, series, value...])
+        
+        Returns:
+            tuple: (value, error). value is the validated score, the
+                   SxxExx episode code, or None for snooze/unsnooze;
+                   error is a formatted message when the value is missing
+        
+        Raises:
+            ValidationError: If the value is present but invalid
+        """
+        if action == "score":
+            if len(args) < 3:
+                return None, (
+                    self.error_msg("Missing score value") + "\n\n"
+                    "Usage: update score <imdb_id> <1-10>"
+                )
+            return validate_score(args[2]), None
+        if action == "episode":
+            if len(args) < 3:
+                return None, (
+                    self.error_msg("Missing episode code") + "\n\n"
+                    "Usage: update episode <imdb_id> <episode>\n\n"
+                    "Formats accepted: S01E05, 1x5, s1e5"
+                )
+            season, episode = validate_episode_format(args[2])
+            return f"S{season:02d}E{episode:02d}", None
+        return None, None
+    
+    def bulk_execute(self, args_list):
+        """
+        Apply many updates at once, writing them in a single transaction.
+        
+        Every line is validated and its series resolved before anything
+        is written; invalid lines are reported and skipped.
+        
+        Args:
+            args_list: List of argument lists, one per update
+                       (same format as for execute)
+        
+        Returns:
+            str: Summary of applied updates and invalid lines
+        """
+        with self.log_op("Update series batch", rows=len(args_list)) as op:
+            updates = {"score": [], "snooze": [], "episode": []}
+            errors = []
+            
+            try:
+                # Validate every line before writing anything
+                pending = []  # (line_no, action, value, imdb_id or None, identifier)
+                for line_no, args in enumerate(args_list, 1):
+                    if not args:
+                        continue
+                    if len(args) < 2:
+                        errors.append((line_no, "missing series"))
+                        continue
+                    
+                    action = self._action_name(args[0])
+                    if action not in self._ACTIONS:
+                        errors.append((line_no, f"unknown action '{action}'"))
+                        continue
+                    
+                    try:
+                        value, error = self._parse_value(action, args)
+                        ident = parse_identifier(args[1])
+                        imdb_id = validate_imdb_link(ident) if ident.is_imdb else None
+                    except ValidationError as e:
+                        errors.append((line_no, str(e)))
+                        continue
+                    if error:
+                        errors.append((line_no, f"missing {action} value"))
+                        continue
+                    pending.append((line_no, action, value, imdb_id, args[1]))
+                
+                # Lines given by IMDB ID are looked up in one query; names
+                # still go through resolve_series()
+                by_id = self.db_manager.get_series_many(
+                    [imdb_id for _, _, _, imdb_id, _ in pending if imdb_id]
+                )
+                
+                for line_no, action, value, imdb_id, identifier in pending:
+                    if imdb_id:
+                        series = by_id.get(imdb_id)
+                        if series is None:
+                            errors.append((line_no, f"Series with IMDB ID '{imdb_id}' not found."))
+                            continue
+                    else:
+                        series, error = self.resolve_series(identifier)
+                        if error:
+                            errors.append((line_no, error.splitlines()[0]))
+                            continue
+                    
+                    if action == "unsnooze":
+                        updates["snooze"].append((series.imdb_id, False))
+                    elif action == "snooze":
+                        updates["snooze"].append((series.imdb_id, True))
+                    else:
+                        updates[action].append((series.imdb_id, value))
+                
+                updated = self.db_manager.update_series_many(
+                    scores=updates["score"],
+                    snoozes=updates["snooze"],
+                    episodes=updates["episode"]
+                )
+                op.success(f"Batch applied {updated} updates")
+            
+            except Exception as e:
+                op.error(str(e))
+                return self.error_msg(f"Failed to apply update batch: {e}")
+        
+        lines = [self.success_msg(f"Applied {updated} update(s) in batch mode")]
+        if errors:
+            lines.append("")
+            lines.append(self.error_msg(f"{len(errors)} invalid line(s):"))
+            lines.extend(f"  Line {line_no}: {message}" for line_no, message in sorted(errors))
+        
+        return "\n".join(lines)
+    
+    def _update_score(self, series, new_score, op):
+        """Update series score (new_score already validated)."""
         old_score = series.score
         updated = self.db_manager.update_score(series.imdb_id, new_score)
         
@@ -101,8 +231,8 @@ class UpdateCommand(Command):
         op.error("Database update failed")
         return self.error_msg(f"Failed to update score for {series.imdb_id}")
     
-    def _snooze_series(self, series, op):
-        """Snooze a series."""
+    def _snooze_series(self, series, value, op):
+        """Snooze a series (takes no value)."""
         if series.snoozed:
             return self.warning_msg(f"Series '{series.name}' is already snoozed")
         
@@ -118,8 +248,8 @@ class UpdateCommand(Command):
         op.error("Database update failed")
         return self.error_msg(f"Failed to snooze series {series.imdb_id}")
     
-    def _unsnooze_series(self, series, op):
-        """Unsnooze a series."""
+    def _unsnooze_series(self, series, value, op):
+        """Unsnooze a series (takes no value)."""
         if not series.snoozed:
             return self.warning_msg(f"Series '{series.name}' is not snoozed")
         
@@ -134,18 +264,8 @@ class UpdateCommand(Command):
         op.error("Database update failed")
         return self.error_msg(f"Failed to unsnooze series {series.imdb_id}")
     
-    def _update_episode(self, series, args, op):
-        """Update last watched episode."""
-        if len(args) < 3:
-            return (
-                self.error_msg("Missing episode code") + "\n\n"
-                "Usage: update episode <imdb_id> <episode>\n\n"
-                "Formats accepted: S01E05, 1x5, s1e5"
-            )
-        
-        episode_str = args[2]
-        season, episode = validate_episode_format(episode_str)
-        episode_code = f"S{season:02d}E{episode:02d}"
+    def _update_episode(self, series, episode_code, op):
+        """Update last watched episode (episode_code already normalized)."""
         old_episode = series.last_episode
         
         updated = self.db_manager.update_last_episode(series.imdb_id, episode_code)
@@ -160,6 +280,15 @@ class UpdateCommand(Command):
         op.error("Database update failed")
         return self.error_msg(f"Failed to update episode for {series.imdb_id}")
     
+    # Actions accepted by 'update', mapped to their handler; every handler
+    # takes (series, value, op)
+    _ACTIONS = {
+        "score": _update_score,
+        "snooze": _snooze_series,
+        "unsnooze": _unsnooze_series,
+        "episode": _update_episode,
+    }
+    
     def get_help(self):
         """Return help text for update command."""
         return '''
@@ -182,4 +311,7 @@ Examples:
   update snooze "Game of Thrones"
   update unsnooze tt4574334
   update episode "Breaking Bad" S03E07
+
+Batch mode (all changes in one transaction):
+  update-batch < updates.txt        One update line per change
         '''
\ No newline at end of file
@@ -26,6 +26,8 @@ COMMAND OPTIONS:
 - --top N: Show only top N episodes (default: show all)
 - --min-score N: Only include series with score >= N
 - --next: Show only the single next episode to watch
+- --refresh: Rebuild the watchlist instead of reusing one built in the
+  last WATCHLIST_COMMAND_CACHE_TTL seconds
 
 USAGE EXAMPLES:
 ===============
@@ -35,8 +37,74 @@ USAGE EXAMPLES:
     watchlist --next       # Just tell me what to watch next
 """
 
-from .base import Command
-from ..services.episode_ranker import EpisodeRanker
+from itertools import groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING
+from .base import Command, shared_service
+from ..config.settings import WATCHLIST_COMMAND_CACHE_TTL
+
+if TYPE_CHECKING:
+    from ..services.episode_ranker import EpisodeRanker
+
+
+# Output separators, built once
+_SEP_WIDE = "═" * 70
+_SEP_HEAVY = "═" * 60
+
+# Boolean flags and integer-valued flags, mapped to their option name
+_BOOL_FLAGS = {
+    '--next': 'next', '-n': 'next',
+    '--refresh': 'refresh', '-r': 'refresh',
+}
+_INT_FLAGS = {
+    '--top': 'top', '-t': 'top',
+    '--min-score': 'min_score', '-s': 'min_score',
+}
+
+
+def _parse_args(args: list) -> dict:
+    """
+    Parse watchlist command arguments in a single pass.
+    
+    Boolean flags map to True and integer flags consume the next token;
+    the first occurrence of a flag wins. Other tokens are ignored.
+    
+    Args:
+        args: Command arguments
+    
+    Returns:
+        dict: Keys 'next', 'refresh', 'top', 'min_score'
+    
+    Raises:
+        ValueError: If an integer flag has no value or a non-numeric one
+    """
+    parsed = {'next': False, 'refresh': False, 'top': None, 'min_score': None}
+    it = iter(args)
+    for arg in it:
+        if arg in _BOOL_FLAGS:
+            parsed[_BOOL_FLAGS[arg]] = True
+        elif arg in _INT_FLAGS:
+            value = next(it, None)
+            if value is None:
+                raise ValueError(f"{arg} expects a number")
+            try:
+                number = int(value)
+            except ValueError:
+                raise ValueError(f"{arg} expects a number, got '{value}'")
+            key = _INT_FLAGS[arg]
+            if parsed[key] is None:
+                parsed[key] = number
+    return parsed
+
+
+# Closing tips of the full watchlist, identical on every run
+_TIPS = (
+    "",
+    "Tips:",
+    "  • Use 'watchlist --top 10' to see only top 10",
+    "  • Use 'watchlist --next' for single recommendation",
+    "  • Use 'update episode <imdb_id> <code>' after watching",
+)
 
 
 class WatchlistCommand(Command):
@@ -55,11 +123,20 @@ class WatchlistCommand(Command):
         """
         Initialize with database manager.
         
-        The EpisodeRanker is created fresh for each command execution
-        to ensure it has the latest database state.
+        The EpisodeRanker is fetched on first use and shared with the
+        other commands; its watchlist cache is keyed by the series table
+        state, so database changes still show up immediately.
         """
         super().__init__(db_manager)
-        self.ranker = EpisodeRanker(db_manager)
+        self._ranker = None
+    
+    @property
+    def ranker(self) -> 'EpisodeRanker':
+        """Episode ranker shared with the other commands, fetched on first use."""
+        if self._ranker is None:
+            from ..services.episode_ranker import EpisodeRanker
+            self._ranker = shared_service(self.db_manager, 'episode_ranker', EpisodeRanker)
+        return self._ranker
     
     def execute(self, args):
         """
@@ -68,25 +145,33 @@ class WatchlistCommand(Command):
         Parses arguments and displays prioritized episode list.
         
         Args:
-            args: Command arguments (--top, --min-score, --next)
+            args: Command arguments (--top, --min-score, --next, --refresh)
             
         Returns:
             str: Formatted watchlist output
         """
         try:
-            # Parse arguments
-            top_n = self._parse_int_arg(args, '--top', '-t')
-            min_score = self._parse_int_arg(args, '--min-score', '-s')
-            show_next_only = '--next' in args or '-n' in args
+            # Parse arguments (single pass)
+            try:
+                parsed = _parse_args(args)
+            except ValueError as e:
+                return self.error_msg(str(e)) + "\n\nUse 'help watchlist' for usage."
+            top_n = parsed['top']
+            min_score = parsed['min_score']
+            refresh = parsed['refresh']
             
             # Handle --next flag (show single episode)
-            if show_next_only:
-                return self._format_next_episode()
+            if parsed['next']:
+                return self._format_next_episode(refresh)
             
-            # Get full prioritized watchlist
+            # Get full prioritized watchlist (reused while the series
+            # table is unchanged and the result is recent, see WatchlistCache)
             watchlist = self.ranker.get_prioritized_watchlist(
                 min_score=min_score,
-                max_results=top_n
+                max_results=top_n,
+                use_cache=True,
+                refresh_cache=refresh,
+                cache_max_age=WATCHLIST_COMMAND_CACHE_TTL
             )
             
             return self._format_watchlist(watchlist, top_n, min_score)
@@ -96,48 +181,29 @@ class WatchlistCommand(Command):
             self.logger.error(error_msg)
             return f"[ERROR] {error_msg}"
     
-    def _parse_int_arg(self, args, long_flag, short_flag):
+    def _format_next_episode(self, refresh: bool = False) -> str:
         """
-        Parse an integer argument from command args.
+        Format output for --next flag (single episode recommendation).
         
-        Handles both formats:
-            --top 10
-            -t 10
-            
         Args:
-            args: List of command arguments
-            long_flag: Long form (e.g., '--top')
-            short_flag: Short form (e.g., '-t')
-            
-        Returns:
-            int value or None if not found
-        """
-        for flag in [long_flag, short_flag]:
-            if flag in args:
-                try:
-                    idx = args.index(flag)
-                    if idx + 1 < len(args):
-                        return int(args[idx + 1])
-                except (ValueError, IndexError):
-                    pass
-        return None
-    
-    def _format_next_episode(self) -> str:
-        """
-        Format output for --next flag (single episode recommendation).
+            refresh: Rebuild the watchlist instead of using the cached one
         
         Returns:
             Formatted string with next episode to watch
         """
-        next_ep = self.ranker.get_next_episode()
+        next_ep = self.ranker.get_next_episode(
+            use_cache=True,
+            refresh_cache=refresh,
+            cache_max_age=WATCHLIST_COMMAND_CACHE_TTL
+        )
         
         if not next_ep:
             return "[OK] All caught up! No new episodes to watch."
         
         lines = [
-            "═" * 60,
+            _SEP_HEAVY,
             "NEXT UP",
-            "═" * 60,
+            _SEP_HEAVY,
             "",
             f"  {next_ep.series_name}",
             f"  {next_ep.episode_code}: {next_ep.episode_title}",
@@ -149,7 +215,7 @@ class WatchlistCommand(Command):
         
         lines.extend([
             "",
-            "═" * 60,
+            _SEP_HEAVY,
             "Tip: Use 'update episode <imdb_id> <episode>' after watching"
         ])
         
@@ -183,7 +249,7 @@ class WatchlistCommand(Command):
         lines = []
         
         # Header
-        lines.append("═" * 70)
+        lines.append(_SEP_WIDE)
         lines.append(f"YOUR WATCHLIST ({len(watchlist)} episodes to watch)")
         
         # Show active filters
@@ -195,49 +261,44 @@ class WatchlistCommand(Command):
         if filters:
             lines.append(f"   Filters: {', '.join(filters)}")
         
-        lines.append("═" * 70)
+        lines.append(_SEP_WIDE)
         lines.append("")
         
-        # Group by score for visual clarity
-        current_score = None
+        # Group by score for visual clarity (the watchlist is sorted by
+        # score, so groupby yields each score once); the same pass
+        # collects the series names for the summary
+        series_names = set()
         
-        for ep in watchlist:
-            # Add score separator when score changes
-            if ep.score != current_score:
-                if current_score is not None:
-                    lines.append("")  # Blank line between score groups
-                lines.append(f"── Score: {ep.score}/10 ──")
-                current_score = ep.score
-            
-            # Format episode line
-            # Rank is right-padded, series name is also padded for alignment
-            rank_str = f"#{ep.priority_rank:>3}"
-            
-            # Build episode info
-            ep_info = f"{ep.series_name} - {ep.episode_code}"
-            if ep.episode_title and ep.episode_title != "Unknown":
-                ep_info += f": {ep.episode_title}"
+        for i, (score, group) in enumerate(groupby(watchlist, key=attrgetter('score'))):
+            if i:
+                lines.append("")  # Blank line between score groups
+            lines.append(f"── Score: {score}/10 ──")
             
-            lines.append(f"{rank_str}  {ep_info}")
-            
-            # Show air date on separate line for longer entries
-            if ep.air_date:
-                lines.append(f"        Aired: {ep.air_date}")
+            for ep in group:
+                series_names.add(ep.series_name)
+                
+                # Format episode line (rank right-aligned in 3 columns)
+                if ep.episode_title and ep.episode_title != "Unknown":
+                    lines.append(
+                        f"#{ep.priority_rank:>3}  {ep.series_name} - "
+                        f"{ep.episode_code}: {ep.episode_title}"
+                    )
+                else:
+                    lines.append(f"#{ep.priority_rank:>3}  {ep.series_name} - {ep.episode_code}")
+                
+                # Show air date on separate line for longer entries
+                if ep.air_date:
+                    lines.append(f"        Aired: {ep.air_date}")
         
         # Footer
         lines.append("")
-        lines.append("═" * 70)
+        lines.append(_SEP_WIDE)
         
         # Summary stats
-        series_names = set(ep.series_name for ep in watchlist)
         lines.append(f"Summary: {len(watchlist)} episodes across {len(series_names)} series")
         
         # Tips
-        lines.append("")
-        lines.append("Tips:")
-        lines.append("  • Use 'watchlist --top 10' to see only top 10")
-        lines.append("  • Use 'watchlist --next' for single recommendation")
-        lines.append("  • Use 'update episode <imdb_id> <code>' after watching")
+        lines.extend(_TIPS)
         
         return "\n".join(lines)
     
@@ -250,12 +311,18 @@ Episodes are ranked by:
   1. Series score (higher scores first)
   2. Episode order (earlier episodes first)
 
+The list is cached: running watchlist again within 15 minutes reuses
+it, so episodes aired in the meantime show up only after that (or with
+--refresh). Changing your series (score, episode, snooze...) always
+rebuilds it.
+
 Usage: watchlist [options]
 
 Options:
   --top N, -t N         Show only top N episodes
   --min-score N, -s N   Only include series with score >= N
   --next, -n            Show only the next episode to watch
+  --refresh, -r         Rebuild the list now instead of reusing it
 
 Examples:
   watchlist                  Show full ranked watchlist
@@ -3,11 +3,10 @@ Configuration settings for BingeWatch application.
 Centralizes all configuration constants for easy maintenance.
 """
 
-import os
 from pathlib import Path
 
 # Project root directory
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).parents[2]
 
 # Database settings
 DB_DIR = PROJECT_ROOT / "data"
@@ -29,6 +28,20 @@ IMDB_BASE_URL = "https://www.imdb.com"
 IMDB_EPISODE_PATH = "/title/{}/episodes"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+# IMDB search cache settings
+# SEARCH_CACHE_TTL: Seconds a cached IMDB search result stays valid
+# SEARCH_CACHE_SIZE: Max distinct searches kept in memory (LRU eviction)
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_SIZE = 256
+
+# YouTube search cache settings
+# VIDEO_SEARCH_CACHE_TTL: Seconds a cached YouTube search stays valid
+# - Each trailers search is several YouTube requests (rate-limited)
+# - Kept short so 'check' still sees new uploads in a long session
+# VIDEO_SEARCH_CACHE_SIZE: Max distinct searches kept in memory (LRU eviction)
+VIDEO_SEARCH_CACHE_TTL = 600
+VIDEO_SEARCH_CACHE_SIZE = 256
+
 # HTTP Client settings
 # REQUEST_TIMEOUT: How long to wait for a response before giving up
 # - Too short: fails on slow connections
@@ -58,11 +71,40 @@ IMDB_SEASON_URL = "https://www.imdb.com/title/{imdb_id}/episodes?season={season}
 # Example: https://www.imdb.com/find/?q=breaking+bad&s=tt&ttype=tv
 IMDB_SEARCH_URL = "https://www.imdb.com/find/?q={query}&s=tt&ttype=tv"
 
+# Watchlist cache settings
+# WATCHLIST_CACHE_TTL: Seconds a cached 'episodes'/'watchlist' result stays valid
+# - Building it scrapes IMDB for every series, which takes seconds
+# - Watching an episode (or any series change) invalidates it right away;
+#   the TTL only bounds how long newly aired episodes can go unnoticed
+WATCHLIST_CACHE_TTL = 86400
+
+# WATCHLIST_COMMAND_CACHE_TTL: Max age of a cached result reused by 'watchlist'
+# - 'watchlist' is the "what's new right now" view, so a day-old list
+#   would hide episodes that aired since; 'watchlist --refresh' skips it
+WATCHLIST_COMMAND_CACHE_TTL = 900
+
+# WATCHLIST_MAX_WORKERS: Series fetched from IMDB in parallel when ranking
+# - Ranking is dominated by IMDB round-trips, not by the sort itself
+WATCHLIST_MAX_WORKERS = 4
+
+# Check command settings
+# CHECK_MAX_WORKERS: Series checked in parallel by 'check' (override: --jobs N)
+# - The check mostly waits on IMDB/YouTube, so threads overlap that latency
+# - Kept small to stay well under YouTube's rate limits
+CHECK_MAX_WORKERS = 4
+
+# Batch add settings
+# ADD_BATCH_SIZE: Max rows inserted per transaction by 'add-batch'
+# - One transaction = one commit/fsync, so bigger batches are faster
+# - Capped to keep the pending row list small in memory
+ADD_BATCH_SIZE = 2000
+
 # Validation settings
 MIN_SCORE = 1
 MAX_SCORE = 10
 IMDB_ID_PREFIX = "tt"
 
-# Create necessary directories
-DB_DIR.mkdir(parents=True, exist_ok=True)
-LOG_DIR.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+# Create necessary directories (a single stat per directory once they exist)
+for _directory in (DB_DIR, LOG_DIR):
+    if not _directory.is_dir():
+        _directory.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -21,15 +21,75 @@ KEY RESPONSIBILITIES:
 - Duplicate/similarity detection
 """
 
+import hashlib
 import sqlite3
-from typing import List, Optional
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from contextlib import contextmanager
 
-from .models import Series
+from .models import Series, SERIES_COLUMNS
 from ..config.settings import DB_PATH
 from ..utils.logger import get_logger
 
 
+# Score updates for more than this many distinct series are merged into
+# one UPDATE ... CASE statement instead of one execute per row
+_MERGE_MIN_ROWS = 4
+
+# Rows per merged UPDATE; each row binds 3 parameters, which keeps a
+# statement under SQLite's default limit of 999
+_MERGE_CHUNK_ROWS = 300
+
+# IDs per SELECT ... IN (...) lookup, under the same parameter limit
+_SELECT_CHUNK_ROWS = 900
+
+# Series kept by get_series() after a lookup (oldest evicted first).
+# Series are immutable, so cached instances can be handed out as-is
+_SERIES_CACHE_SIZE = 512
+
+# Fixed statements, defined once. Every operation passes the same SQL text,
+# so the shared connection's statement cache prepares each one only once
+_SQL_INSERT = (
+    "INSERT INTO series (name, imdb_id, last_episode, last_watch_date, score, snoozed) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_DELETE = "DELETE FROM series WHERE imdb_id = ?"
+_SQL_SELECT_BY_ID = f"SELECT {SERIES_COLUMNS} FROM series WHERE imdb_id = ?"
+_SQL_UPDATE_SCORE = "UPDATE series SET score = ? WHERE imdb_id = ?"
+_SQL_UPDATE_SNOOZE = "UPDATE series SET snoozed = ? WHERE imdb_id = ?"
+_SQL_UPDATE_EPISODE = (
+    "UPDATE series SET last_episode = ?, last_watch_date = ? WHERE imdb_id = ?"
+)
+
+
+def _sql_casefold(value):
+    """casefold() registered as an SQL function (SQLite's LOWER is ASCII-only)."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _name_match(query: str, exact: bool = False) -> Tuple[str, tuple]:
+    """
+    Build a case-insensitive name condition for a WHERE clause.
+    
+    An exact ASCII query goes through the LOWER(name) index. A non-ASCII
+    exact query, and every substring query (a leading-wildcard LIKE can't
+    use an index anyway), compare through the casefold() SQL function,
+    so accented names fold the way Python compares them.
+    
+    Args:
+        query: Name, or text the name must contain
+        exact: Whether the whole name must match
+    
+    Returns:
+        tuple: (SQL condition, parameters)
+    """
+    if exact:
+        if query.isascii():
+            return "LOWER(name) = LOWER(?)", (query,)
+        return "casefold(name) = ?", (query.casefold(),)
+    return "instr(casefold(name), ?) > 0", (query.casefold(),)
+
+
 class DBManager:
     """
     Manages database operations for BingeWatch.
@@ -45,25 +105,62 @@ class DBManager:
         """
         self.db_path = db_path or DB_PATH
         self.logger = get_logger()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Serializes use of the shared connection ('add' looks up similar
+        # names from a worker thread)
+        self._lock = threading.Lock()
+        # Lookaside cache for get_series(), by IMDB ID. Read, filled and
+        # invalidated only while holding _lock, so it never outlives a write
+        self._series_cache: Dict[str, Series] = {}
+        # Service objects shared by every command on this database (the
+        # episode ranker, the notification service), created on first use
+        # by their owners; they live exactly as long as this manager
+        self.shared_services: Dict[str, object] = {}
         self._initialize_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection shared by all operations of this manager."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.create_function("casefold", 1, _sql_casefold, deterministic=True)
+        # Connection settings. With WAL (set once in _initialize_database)
+        # NORMAL only syncs at checkpoints and stays safe against
+        # application crashes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # The connection is kept open, so a larger page cache (8 MB,
+        # negative = KiB) keeps the series table in memory between queries
+        conn.execute("PRAGMA cache_size=-8000")
+        return conn
+    
     @contextmanager
     def _get_connection(self):
         """
-        Context manager for database connections.
-        Ensures proper connection handling and cleanup.
+        Context manager for database access.
+        
+        Yields the manager's long-lived connection (opened on first use)
+        under a lock. Each block is one transaction: committed on
+        success, rolled back on error.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            self.logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                self.logger.error(f"Database error: {e}")
+                raise
+    
+    def close(self):
+        """Close the shared connection (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._series_cache.clear()
     
     def _initialize_database(self):
         """Create the series table if it doesn't exist."""
@@ -83,11 +180,21 @@ class DBManager:
         CREATE INDEX IF NOT EXISTS idx_imdb_id ON series(imdb_id);
         """
         
+        create_name_index_sql = """
+        CREATE INDEX IF NOT EXISTS idx_series_name_lower ON series(LOWER(name));
+        """
+        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # WAL is stored in the database file, so enabling it once
+                # covers every later connection
+                journal_mode = cursor.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if journal_mode.lower() != "wal":
+                    self.logger.warning(f"WAL not available, using journal_mode={journal_mode}")
                 cursor.execute(create_table_sql)
                 cursor.execute(create_index_sql)
+                cursor.execute(create_name_index_sql)
             self.logger.info("Database initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {e}")
@@ -106,15 +213,10 @@ class DBManager:
         Raises:
             sqlite3.IntegrityError: If series with same IMDB ID exists
         """
-        insert_sql = """
-        INSERT INTO series (name, imdb_id, last_episode, last_watch_date, score, snoozed)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """
-        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(insert_sql, (
+                cursor.execute(_SQL_INSERT, (
                     series.name,
                     series.imdb_id,
                     series.last_episode,
@@ -131,6 +233,42 @@ class DBManager:
             self.logger.error(f"Series with IMDB ID {series.imdb_id} already exists")
             raise ValueError(f"Series with IMDB ID {series.imdb_id} already exists")
     
+    def add_series_many(self, series_list: Iterable[Series]) -> int:
+        """
+        Add many series in a single transaction.
+
+        All rows go through one executemany() and one commit, so a bulk
+        import pays for a single fsync instead of one per series.
+
+        Args:
+            series_list: Series objects to add (any iterable; rows are
+                         streamed into executemany, not copied to a list)
+
+        Returns:
+            int: Number of inserted rows
+
+        Raises:
+            ValueError: If any IMDB ID already exists (nothing is inserted)
+        """
+        rows = (
+            (s.name, s.imdb_id, s.last_episode, s.last_watch_date, s.score, s.snoozed)
+            for s in series_list
+        )
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(_SQL_INSERT, rows)
+                inserted = max(cursor.rowcount, 0)
+
+            if inserted:
+                self.logger.info(f"Added {inserted} series in one batch")
+            return inserted
+
+        except sqlite3.IntegrityError as e:
+            self.logger.error(f"Batch insert failed: {e}")
+            raise ValueError(f"Batch contains a series that already exists: {e}")
+
     def delete_series(self, imdb_id: str) -> bool:
         """
         Delete a series from the database.
@@ -141,13 +279,12 @@ class DBManager:
         Returns:
             bool: True if deleted, False if not found
         """
-        delete_sql = "DELETE FROM series WHERE imdb_id = ?"
-        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(delete_sql, (imdb_id,))
+                cursor.execute(_SQL_DELETE, (imdb_id,))
                 deleted = cursor.rowcount > 0
+                self._series_cache.pop(imdb_id, None)
             
             if deleted:
                 self.logger.info(f"Deleted series with IMDB ID: {imdb_id}")
@@ -160,6 +297,46 @@ class DBManager:
             self.logger.error(f"Error deleting series {imdb_id}: {e}")
             raise
     
+    def delete_series_returning(self, imdb_id: str) -> Optional[Series]:
+        """
+        Delete a series and return the removed row, in one round trip.
+        
+        Uses DELETE ... RETURNING (SQLite 3.35+); older SQLite versions
+        run a SELECT and the DELETE in the same transaction instead.
+        
+        Args:
+            imdb_id: IMDB ID of the series to delete
+        
+        Returns:
+            The deleted Series, or None if not found
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                if sqlite3.sqlite_version_info >= (3, 35, 0):
+                    cursor.execute(
+                        f"DELETE FROM series WHERE imdb_id = ? RETURNING {SERIES_COLUMNS}",
+                        (imdb_id,)
+                    )
+                    row = cursor.fetchone()
+                else:
+                    cursor.execute(_SQL_SELECT_BY_ID, (imdb_id,))
+                    row = cursor.fetchone()
+                    if row:
+                        cursor.execute(_SQL_DELETE, (imdb_id,))
+                self._series_cache.pop(imdb_id, None)
+            
+            if row:
+                self.logger.info(f"Deleted series with IMDB ID: {imdb_id}")
+                return Series.from_db_row(row)
+            
+            self.logger.warning(f"Series with IMDB ID {imdb_id} not found")
+            return None
+        
+        except Exception as e:
+            self.logger.error(f"Error deleting series {imdb_id}: {e}")
+            raise
+    
     def update_score(self, imdb_id: str, score: int) -> bool:
         """
         Update the score of a series.
@@ -171,13 +348,12 @@ class DBManager:
         Returns:
             bool: True if updated, False if not found
         """
-        update_sql = "UPDATE series SET score = ? WHERE imdb_id = ?"
-        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(update_sql, (score, imdb_id))
+                cursor.execute(_SQL_UPDATE_SCORE, (score, imdb_id))
                 updated = cursor.rowcount > 0
+                self._series_cache.pop(imdb_id, None)
             
             if updated:
                 self.logger.info(f"Updated score for {imdb_id} to {score}")
@@ -201,13 +377,12 @@ class DBManager:
         Returns:
             bool: True if updated, False if not found
         """
-        update_sql = "UPDATE series SET snoozed = ? WHERE imdb_id = ?"
-        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(update_sql, (1 if snoozed else 0, imdb_id))
+                cursor.execute(_SQL_UPDATE_SNOOZE, (1 if snoozed else 0, imdb_id))
                 updated = cursor.rowcount > 0
+                self._series_cache.pop(imdb_id, None)
             
             status = "snoozed" if snoozed else "unsnoozed"
             if updated:
@@ -234,19 +409,14 @@ class DBManager:
         """
         from datetime import datetime
         
-        update_sql = """
-        UPDATE series 
-        SET last_episode = ?, last_watch_date = ? 
-        WHERE imdb_id = ?
-        """
-        
         try:
             watch_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(update_sql, (episode, watch_date, imdb_id))
+                cursor.execute(_SQL_UPDATE_EPISODE, (episode, watch_date, imdb_id))
                 updated = cursor.rowcount > 0
+                self._series_cache.pop(imdb_id, None)
             
             if updated:
                 self.logger.info(f"Updated last episode for {imdb_id} to {episode}")
@@ -259,48 +429,223 @@ class DBManager:
             self.logger.error(f"Error updating last episode for {imdb_id}: {e}")
             raise
     
+    def update_series_many(
+        self,
+        scores: Sequence[Tuple[str, int]] = (),
+        snoozes: Sequence[Tuple[str, bool]] = (),
+        episodes: Sequence[Tuple[str, str]] = ()
+    ) -> int:
+        """
+        Apply many updates in a single transaction.
+        
+        Each kind of update goes through one executemany(), and all of
+        them share one commit, so a batch pays for a single fsync.
+        
+        Args:
+            scores: (imdb_id, score) pairs
+            snoozes: (imdb_id, snoozed) pairs
+            episodes: (imdb_id, episode_code) pairs; the watch date is
+                      set to now, as in update_last_episode()
+        
+        Returns:
+            int: Number of updated rows
+        """
+        from datetime import datetime
+        
+        if not (scores or snoozes or episodes):
+            return 0
+        
+        # Later updates of the same series win, as they would run in order
+        score_by_id = dict(scores)
+        merge_scores = len(score_by_id) > _MERGE_MIN_ROWS
+        
+        watch_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        statements = (
+            (_SQL_UPDATE_SCORE,
+             [] if merge_scores else [(score, imdb_id) for imdb_id, score in score_by_id.items()]),
+            (_SQL_UPDATE_SNOOZE,
+             [(1 if snoozed else 0, imdb_id) for imdb_id, snoozed in snoozes]),
+            (_SQL_UPDATE_EPISODE,
+             [(episode, watch_date, imdb_id) for imdb_id, episode in episodes]),
+        )
+        
+        try:
+            updated = 0
+            with self._get_connection() as conn:
+                # Batches touch many series at once; drop every cached one
+                self._series_cache.clear()
+                cursor = conn.cursor()
+                if merge_scores:
+                    updated += self._update_scores_merged(cursor, score_by_id)
+                for update_sql, rows in statements:
+                    if rows:
+                        cursor.executemany(update_sql, rows)
+                        updated += cursor.rowcount
+            
+            self.logger.info(f"Applied {updated} updates in one batch")
+            return updated
+        
+        except Exception as e:
+            self.logger.error(f"Batch update failed: {e}")
+            raise
+    
+    def update_scores_merged(self, scores: dict) -> int:
+        """
+        Update the scores of many series with merged UPDATE statements.
+        
+        Args:
+            scores: Mapping of IMDB ID to new score
+        
+        Returns:
+            int: Number of updated rows
+        """
+        if not scores:
+            return 0
+        
+        try:
+            with self._get_connection() as conn:
+                self._series_cache.clear()
+                updated = self._update_scores_merged(conn.cursor(), scores)
+            
+            self.logger.info(f"Updated {updated} scores in one batch")
+            return updated
+        
+        except Exception as e:
+            self.logger.error(f"Merged score update failed: {e}")
+            raise
+    
+    def _update_scores_merged(self, cursor, scores: dict) -> int:
+        """
+        Run the merged score UPDATEs on an open cursor.
+        
+        Each statement sets up to _MERGE_CHUNK_ROWS scores at once:
+        UPDATE series SET score = CASE imdb_id WHEN ? THEN ? ... END
+        WHERE imdb_id IN (?, ...). Values are always bound, never
+        formatted into the SQL.
+        
+        Args:
+            cursor: Cursor of the caller's transaction
+            scores: Mapping of IMDB ID to new score
+        
+        Returns:
+            int: Number of updated rows
+        """
+        items = list(scores.items())
+        updated = 0
+        for start in range(0, len(items), _MERGE_CHUNK_ROWS):
+            chunk = items[start:start + _MERGE_CHUNK_ROWS]
+            update_sql = (
+                "UPDATE series SET score = CASE imdb_id "
+                + " ".join(["WHEN ? THEN ?"] * len(chunk))
+                + f" END WHERE imdb_id IN ({', '.join(['?'] * len(chunk))})"
+            )
+            params = [value for pair in chunk for value in pair]
+            params.extend(imdb_id for imdb_id, _ in chunk)
+            cursor.execute(update_sql, params)
+            updated += cursor.rowcount
+        return updated
+    
     def get_series(self, imdb_id: str) -> Optional[Series]:
         """
         Retrieve a series by IMDB ID.
         
+        Found series are kept in a small in-process cache, so repeated
+        lookups of the same ID skip SQLite. Every write through this
+        manager invalidates the affected entries.
+        
         Args:
             imdb_id: IMDB ID of the series
             
         Returns:
             Series object or None if not found
         """
-        select_sql = "SELECT * FROM series WHERE imdb_id = ?"
-        
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(select_sql, (imdb_id,))
-                row = cursor.fetchone()
+                series = self._series_cache.get(imdb_id)
+                if series is None:
+                    cursor = conn.cursor()
+                    cursor.execute(_SQL_SELECT_BY_ID, (imdb_id,))
+                    row = cursor.fetchone()
+                    if row:
+                        series = Series.from_db_row(row)
+                        if len(self._series_cache) >= _SERIES_CACHE_SIZE:
+                            del self._series_cache[next(iter(self._series_cache))]
+                        self._series_cache[imdb_id] = series
             
-            if row:
-                return Series.from_db_row(row)
-            return None
+            return series
         
         except Exception as e:
             self.logger.error(f"Error retrieving series {imdb_id}: {e}")
             raise
     
-    def get_all_series(self, include_snoozed: bool = True) -> List[Series]:
+    def get_series_many(self, imdb_ids: Sequence[str]) -> Dict[str, Series]:
+        """
+        Retrieve many series by IMDB ID with IN (...) lookups.
+        
+        Args:
+            imdb_ids: IMDB IDs to look up (duplicates are fine)
+        
+        Returns:
+            Dict mapping each found IMDB ID to its Series; IDs that are
+            not tracked are simply missing
+        """
+        ids = list(dict.fromkeys(imdb_ids))
+        if not ids:
+            return {}
+        
+        try:
+            found = {}
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(ids), _SELECT_CHUNK_ROWS):
+                    chunk = ids[start:start + _SELECT_CHUNK_ROWS]
+                    select_sql = (
+                        f"SELECT {SERIES_COLUMNS} FROM series WHERE imdb_id IN "
+                        f"({', '.join(['?'] * len(chunk))})"
+                    )
+                    cursor.execute(select_sql, chunk)
+                    for row in cursor.fetchall():
+                        series = Series.from_db_row(row)
+                        found[series.imdb_id] = series
+            return found
+        
+        except Exception as e:
+            self.logger.error(f"Error retrieving series batch: {e}")
+            raise
+    
+    def get_all_series(
+        self,
+        include_snoozed: bool = True,
+        min_score: Optional[int] = None,
+        name_like: Optional[str] = None
+    ) -> List[Series]:
         """
         Retrieve all series from the database.
         
         Args:
             include_snoozed: Whether to include snoozed series
+            min_score: Only series with score >= min_score
+            name_like: Only series whose name contains this text
+                       (case-insensitive)
             
         Returns:
-            List of Series objects
+            List of Series objects, fully fetched before the connection
+            closes, so callers can iterate it as often as they like
         """
-        if include_snoozed:
-            select_sql = "SELECT * FROM series ORDER BY score DESC, name ASC"
-            params = ()
-        else:
-            select_sql = "SELECT * FROM series WHERE snoozed = 0 ORDER BY score DESC, name ASC"
-            params = ()
+        conditions = []
+        params = []
+        if not include_snoozed:
+            conditions.append("snoozed = 0")
+        if min_score is not None:
+            conditions.append("score >= ?")
+            params.append(min_score)
+        if name_like:
+            condition, name_params = _name_match(name_like)
+            conditions.append(condition)
+            params.extend(name_params)
+        
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        select_sql = f"SELECT {SERIES_COLUMNS} FROM series{where} ORDER BY score DESC, name ASC"
         
         try:
             with self._get_connection() as conn:
@@ -314,6 +659,119 @@ class DBManager:
             self.logger.error(f"Error retrieving all series: {e}")
             raise
     
+    def count_snoozed(self) -> int:
+        """
+        Count snoozed series without loading them.
+        
+        Returns:
+            Number of snoozed series
+        """
+        count_sql = "SELECT COUNT(*) FROM series WHERE snoozed = 1"
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(count_sql)
+                return cursor.fetchone()[0]
+        
+        except Exception as e:
+            self.logger.error(f"Error counting snoozed series: {e}")
+            raise
+    
+    def get_series_stats(self, top_n: int = 3) -> dict:
+        """
+        Aggregate series statistics in SQL, without loading every series.
+        
+        Args:
+            top_n: Number of top rated series to return
+        
+        Returns:
+            Dict with:
+                - total: Number of tracked series
+                - snoozed: Number of snoozed series
+                - avg_score: Average score (None if there are no series)
+                - top_rated: Highest scored Series, ordered like get_all_series()
+        """
+        totals_sql = "SELECT COUNT(*), COALESCE(SUM(snoozed), 0), AVG(score) FROM series"
+        top_sql = f"SELECT {SERIES_COLUMNS} FROM series ORDER BY score DESC, name ASC LIMIT ?"
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(totals_sql)
+                total, snoozed, avg_score = cursor.fetchone()
+                cursor.execute(top_sql, (top_n,))
+                rows = cursor.fetchall()
+            
+            return {
+                'total': total,
+                'snoozed': snoozed,
+                'avg_score': avg_score,
+                'top_rated': [Series.from_db_row(row) for row in rows],
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error computing series stats: {e}")
+            raise
+    
+    def get_series_state_hash(self) -> str:
+        """
+        Fingerprint of the tracked series and their watch progress.
+        
+        Changes whenever a series is added or removed, or its score,
+        snooze status or last watched episode changes, so it can be used
+        to invalidate results derived from the series table.
+        
+        Returns:
+            Hex digest of the relevant columns of every series
+        """
+        select_sql = "SELECT imdb_id, score, snoozed, last_episode FROM series ORDER BY id"
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(select_sql)
+                rows = cursor.fetchall()
+            
+            digest = hashlib.blake2b(digest_size=16)
+            for row in rows:
+                digest.update(repr(tuple(row)).encode('utf-8'))
+            return digest.hexdigest()
+        
+        except Exception as e:
+            self.logger.error(f"Error computing series state hash: {e}")
+            raise
+    
+    def find_by_name(self, query: str, exact: bool = False) -> List[Series]:
+        """
+        Find series by name, filtering in SQL instead of Python.
+        
+        Args:
+            query: Name (or part of a name) to search for
+            exact: If True, match the whole name (case-insensitive);
+                   otherwise match names containing the query
+        
+        Returns:
+            List of matching Series, ordered like get_all_series()
+        """
+        condition, params = _name_match(query, exact)
+        select_sql = f"""
+        SELECT {SERIES_COLUMNS} FROM series WHERE {condition}
+        ORDER BY score DESC, name ASC
+        """
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(select_sql, params)
+                rows = cursor.fetchall()
+            
+            return [Series.from_db_row(row) for row in rows]
+        
+        except Exception as e:
+            self.logger.error(f"Error searching series by name '{query}': {e}")
+            raise
+    
     def find_similar_by_name(self, name: str, threshold: float = 0.6) -> List[Series]:
         """
         Find series with similar names for duplicate detection.
@@ -327,40 +785,85 @@ class DBManager:
         Returns:
             List of Series that match above threshold
         """
-        all_series = self.get_all_series(include_snoozed=True)
+        candidates = self.get_all_series(include_snoozed=True)
+        return self._filter_similar(name, candidates, threshold)
+    
+    def find_duplicates(
+        self,
+        imdb_id: str,
+        name: str,
+        threshold: float = 0.6
+    ) -> Tuple[Optional[Series], List[Series]]:
+        """
+        Run both duplicate checks used when adding a series with one query.
+        
+        Equivalent to find_by_imdb_id() + find_similar_by_name(), but the
+        rows are fetched once and partitioned in Python, saving a round trip
+        on every add.
+        
+        Args:
+            imdb_id: IMDB ID to look for
+            name: Name to compare against existing series
+            threshold: Similarity threshold (0.0-1.0, default 0.6)
+        
+        Returns:
+            tuple: (series with this IMDB ID or None, list of similar series)
+        """
+        candidates = self.get_all_series(include_snoozed=True)
+        
+        existing = next((s for s in candidates if s.imdb_id == imdb_id), None)
+        if existing:
+            return existing, []
+        
+        return None, self._filter_similar(name, candidates, threshold)
+    
+    def _filter_similar(
+        self,
+        name: str,
+        candidates: List[Series],
+        threshold: float
+    ) -> List[Series]:
+        """
+        Keep the candidates whose name is similar to the given name.
+        
+        Args:
+            name: Name to search for
+            candidates: Series to compare against
+            threshold: Similarity threshold (0.0-1.0)
+        
+        Returns:
+            List of Series that match above threshold
+        """
         similar = []
         
+        # Inputs derived from the searched name are built once; per
+        # candidate, the word set is only built if the cheap substring
+        # checks did not already decide
         name_lower = name.lower().strip()
-        name_words = set(name_lower.split())
+        name_words = frozenset(name_lower.split())
+        short_name = len(name_lower) <= 10
+        names_lower = [series.name.lower().strip() for series in candidates]
         
-        for series in all_series:
-            series_name_lower = series.name.lower().strip()
-            series_words = set(series_name_lower.split())
-            
-            # Exact match
-            if name_lower == series_name_lower:
-                similar.append(series)
-                continue
-            
-            # Check if one name contains the other
+        for series, series_name_lower in zip(candidates, names_lower):
+            # Exact match, or one name contains the other
             if name_lower in series_name_lower or series_name_lower in name_lower:
                 similar.append(series)
                 continue
             
-            # Word overlap (Jaccard similarity)
+            # Word overlap (Jaccard similarity); |A ∪ B| = |A| + |B| - |A ∩ B|
+            series_words = frozenset(series_name_lower.split())
             if name_words and series_words:
                 intersection = len(name_words & series_words)
-                union = len(name_words | series_words)
-                similarity = intersection / union if union > 0 else 0
-                
-                if similarity >= threshold:
+                union = len(name_words) + len(series_words) - intersection
+                if intersection / union >= threshold:
                     similar.append(series)
                     continue
             
             # Character-based similarity for short names
-            if len(name_lower) <= 10 or len(series_name_lower) <= 10:
+            if short_name or len(series_name_lower) <= 10:
                 # Simple ratio: common chars / max length
-                common = sum(1 for c in name_lower if c in series_name_lower)
+                series_chars = frozenset(series_name_lower)
+                common = sum(1 for c in name_lower if c in series_chars)
                 max_len = max(len(name_lower), len(series_name_lower))
                 if max_len > 0 and common / max_len >= threshold:
                     similar.append(series)
@@ -8,11 +8,19 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+# Columns selected for a Series row, in the order from_db_row() reads them
+SERIES_COLUMNS = "id, name, imdb_id, last_episode, last_watch_date, score, snoozed"
+
+
+@dataclass(slots=True, frozen=True)
 class Series:
     """
     Represents a TV series in the database.
     
+    Instances are immutable and use __slots__ (no per-instance __dict__),
+    which keeps memory low when many rows are loaded or batch-added.
+    Changes go through DBManager, which returns fresh instances.
+    
     Attributes:
         name: Series name
         imdb_id: IMDB identifier (e.g., 'tt1234567')
@@ -33,7 +41,10 @@ class Series:
     def __post_init__(self):
         """Set default last_watch_date if not provided."""
         if self.last_watch_date is None:
-            self.last_watch_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Frozen dataclass: bypass the generated __setattr__
+            object.__setattr__(
+                self, 'last_watch_date', datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
     
     def to_dict(self):
         """Convert series to dictionary for database operations."""
@@ -44,20 +55,23 @@ class Series:
         """
         Create Series instance from database row.
         
+        Columns are read by position, which skips the name lookup of
+        sqlite3.Row; the row must be selected with SERIES_COLUMNS.
+        
         Args:
-            row: sqlite3.Row object
+            row: sqlite3.Row (or tuple) selected with SERIES_COLUMNS
             
         Returns:
             Series: New Series instance
         """
         return cls(
-            id=row['id'],
-            name=row['name'],
-            imdb_id=row['imdb_id'],
-            last_episode=row['last_episode'],
-            last_watch_date=row['last_watch_date'],
-            score=row['score'],
-            snoozed=row['snoozed']
+            id=row[0],
+            name=row[1],
+            imdb_id=row[2],
+            last_episode=row[3],
+            last_watch_date=row[4],
+            score=row[5],
+            snoozed=row[6]
         )
     
     def __str__(self):
@@ -70,11 +84,14 @@ class Series:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """
     Represents a TV episode.
     
+    Uses __slots__ like Series: the scraper builds one per aired episode
+    of every tracked series, so the missing __dict__ adds up.
+    
     Attributes:
         series_imdb_id: IMDB ID of the series
         season: Season number
@@ -33,6 +33,10 @@ from .commands.stats_command import StatsCommand
 from .utils.logger import get_logger, set_verbose, set_quiet
 
 
+# Global flags accepted before/after any command
+_GLOBAL_FLAGS = frozenset({'--verbose', '-v', '--quiet', '-q'})
+
+
 class CommandFactory:
     """
     Factory for creating command instances.
@@ -46,23 +50,29 @@ class CommandFactory:
         self._register_commands()
     
     def _register_commands(self):
-        """Register all available commands."""
+        """Register all available commands (aliases share one instance)."""
+        delete = DeleteCommand(self.db_manager)
+        list_cmd = ListCommand(self.db_manager)
+        watchlist = WatchlistCommand(self.db_manager)
+        trailers = TrailersCommand(self.db_manager)
+        episodes = EpisodesCommand(self.db_manager)
+        stats = StatsCommand(self.db_manager)
         self._commands = {
             'add': AddCommand(self.db_manager),
-            'delete': DeleteCommand(self.db_manager),
-            'remove': DeleteCommand(self.db_manager),  # Alias
+            'delete': delete,
+            'remove': delete,  # Alias
             'update': UpdateCommand(self.db_manager),
-            'list': ListCommand(self.db_manager),
-            'ls': ListCommand(self.db_manager),  # Alias
-            'watchlist': WatchlistCommand(self.db_manager),
-            'wl': WatchlistCommand(self.db_manager),  # Alias
-            'trailers': TrailersCommand(self.db_manager),
-            'tr': TrailersCommand(self.db_manager),  # Alias
+            'list': list_cmd,
+            'ls': list_cmd,  # Alias
+            'watchlist': watchlist,
+            'wl': watchlist,  # Alias
+            'trailers': trailers,
+            'tr': trailers,  # Alias
             'check': CheckCommand(self.db_manager),
-            'episodes': EpisodesCommand(self.db_manager),
-            'ep': EpisodesCommand(self.db_manager),  # Alias
-            'stats': StatsCommand(self.db_manager),
-            'st': StatsCommand(self.db_manager),  # Alias
+            'episodes': episodes,
+            'ep': episodes,  # Alias
+            'stats': stats,
+            'st': stats,  # Alias
         }
     
     def get_command(self, command_name: str) -> Command:
@@ -83,6 +93,11 @@ class CommandFactory:
             raise KeyError(f"Unknown command: {command_name}")
         return command
     
+    def refresh_verbosity(self):
+        """Propagate a verbose/quiet mode change to all commands."""
+        for command in self._commands.values():
+            command.refresh_verbosity()
+    
     def get_all_commands(self) -> Dict[str, Command]:
         """Return all registered commands."""
         return self._commands
@@ -120,6 +135,7 @@ class BingeWatchCLI:
 GETTING STARTED (do these first!)
 ─────────────────────────────────────
   add         Add a series → add "Breaking Bad" 9
+  add-batch   Add many series from stdin → add-batch < series.txt
   list        See your series → list
 
 WHAT TO WATCH
@@ -127,6 +143,7 @@ WHAT TO WATCH
   episodes    New episodes across all series → episodes
               Use --debug to show fetching progress
   watchlist   Prioritized by score → watchlist --top 10
+              Reuses the list for 15 minutes; --refresh rebuilds it
 
 DISCOVER CONTENT
 ─────────────────────────────────────
@@ -139,6 +156,8 @@ MANAGE YOUR SERIES
               → update score "Breaking Bad" 10
               → update snooze "Breaking Bad"
               → update episode "Breaking Bad" S05E16
+  update-batch
+              Apply many updates from stdin → update-batch < updates.txt
   delete      Remove series → delete "Breaking Bad"
 
 HELP
@@ -212,7 +231,7 @@ Type 'exit' to quit.
             args: List of arguments
             
         Returns:
-            str: Result message
+            str: Result message (or an iterable of lines, see print_result)
         """
         try:
             command = self.command_factory.get_command(command_name)
@@ -226,6 +245,92 @@ Type 'exit' to quit.
             self.logger.error(f"Command execution error: {e}")
             return f"Error: {e}"
     
+    def print_result(self, result):
+        """
+        Print a command result.
+        
+        Lines are produced while they are written, so an error raised
+        while rendering is reported here the same way execute_command()
+        reports it (lines already written stay on screen).
+        
+        Args:
+            result: Result string, or an iterable of lines that is
+                    written out as it is produced
+        """
+        if isinstance(result, str):
+            print(result)
+            return
+        
+        try:
+            sys.stdout.writelines(f"{line}\n" for line in result)
+        except Exception as e:
+            self.logger.error(f"Command execution error: {e}")
+            print(f"Error: {e}")
+    
+    def run_add_batch(self, stream) -> str:
+        """
+        Read 'add' lines from a stream and add them in one batch.
+        
+        Each line uses the same arguments as 'add' (an optional leading
+        'add' is accepted). Reading stops at EOF or at an empty line,
+        so the batch can also be typed in interactive mode.
+        
+        Args:
+            stream: Text stream to read lines from (e.g., sys.stdin)
+            
+        Returns:
+            str: Result message
+        """
+        args_list = self._read_batch_lines('add', stream)
+        if not args_list:
+            return "[ERROR] No series to add. Provide one 'add' line per series."
+        
+        command = self.command_factory.get_command('add')
+        return command.bulk_execute(args_list)
+    
+    def run_update_batch(self, stream) -> str:
+        """
+        Read 'update' lines from a stream and apply them in one transaction.
+        
+        Each line uses the same arguments as 'update' (an optional leading
+        'update' is accepted). Reading stops at EOF or at an empty line.
+        
+        Args:
+            stream: Text stream to read lines from (e.g., sys.stdin)
+        
+        Returns:
+            str: Result message
+        """
+        args_list = self._read_batch_lines('update', stream)
+        if not args_list:
+            return "[ERROR] No updates given. Provide one 'update' line per change."
+        
+        command = self.command_factory.get_command('update')
+        return command.bulk_execute(args_list)
+    
+    def _read_batch_lines(self, command_name: str, stream) -> list:
+        """
+        Parse batch lines for a command until EOF or an empty line.
+        
+        Args:
+            command_name: Command the lines belong to
+            stream: Text stream to read lines from
+        
+        Returns:
+            list: Argument lists, one per line
+        """
+        args_list = []
+        for raw_line in stream:
+            line = raw_line.strip()
+            if not line:
+                break
+            name, args = self.parse_command(line)
+            if name != command_name:
+                # Line holds only the arguments; re-parse without dropping the first token
+                name, args = self.parse_command(f"{command_name} {line}")
+            args_list.append(args)
+        return args_list
+    
     def run_interactive(self):
         """Run interactive CLI mode."""
         self.print_banner()
@@ -257,9 +362,21 @@ Type 'exit' to quit.
                         self.print_help()
                     continue
                 
+                if command_name == 'add-batch':
+                    print("Enter one series per line, empty line to finish:")
+                    print(self.run_add_batch(sys.stdin))
+                    print()
+                    continue
+                
+                if command_name == 'update-batch':
+                    print("Enter one update per line, empty line to finish:")
+                    print(self.run_update_batch(sys.stdin))
+                    print()
+                    continue
+                
                 # Execute command
                 result = self.execute_command(command_name, args)
-                print(result)
+                self.print_result(result)
                 print()  # Empty line for readability
             
             except KeyboardInterrupt:
@@ -286,16 +403,18 @@ Type 'exit' to quit.
             self.print_help()
             return 1
         
-        # Handle global flags
-        args = list(command_args)
-        if '--verbose' in args or '-v' in args:
+        # Handle global flags (one set for the membership tests, one filter pass)
+        flags = set(command_args) & _GLOBAL_FLAGS
+        args = [a for a in command_args if a not in _GLOBAL_FLAGS] if flags else list(command_args)
+        if flags & {'--verbose', '-v'}:
             set_verbose(True)
-            args = [a for a in args if a not in ('--verbose', '-v')]
             self.logger.debug("Verbose mode enabled")
         
-        if '--quiet' in args or '-q' in args:
+        if flags & {'--quiet', '-q'}:
             set_quiet(True)
-            args = [a for a in args if a not in ('--quiet', '-q')]
+        
+        # Commands cache the verbose flag when created
+        self.command_factory.refresh_verbosity()
         
         if not args:
             print("[ERROR] No command specified")
@@ -311,8 +430,16 @@ Type 'exit' to quit.
                 self.print_help()
             return 0
         
+        if command_name == 'add-batch':
+            print(self.run_add_batch(sys.stdin))
+            return 0
+        
+        if command_name == 'update-batch':
+            print(self.run_update_batch(sys.stdin))
+            return 0
+        
         result = self.execute_command(command_name, command_args)
-        print(result)
+        self.print_result(result)
         return 0
 
 
@@ -320,14 +447,17 @@ def main():
     """Main entry point for BingeWatch application."""
     cli = BingeWatchCLI()
     
-    # Check if running with command-line arguments
-    if len(sys.argv) > 1:
-        # Single command mode
-        exit_code = cli.run_command(sys.argv[1:])
-        sys.exit(exit_code)
-    else:
-        # Interactive mode
-        cli.run_interactive()
+    try:
+        # Check if running with command-line arguments
+        if len(sys.argv) > 1:
+            # Single command mode
+            exit_code = cli.run_command(sys.argv[1:])
+            sys.exit(exit_code)
+        else:
+            # Interactive mode
+            cli.run_interactive()
+    finally:
+        cli.db_manager.close()
 
 
 if __name__ == "__main__":
@@ -32,7 +32,13 @@ from dataclasses import dataclass
 from .base_scraper import BaseScraper
 from .http_client import HTTPClient, FetchError
 from ..database.models import Episode
-from ..config.settings import IMDB_SEASON_URL, IMDB_SEARCH_URL
+from ..config.settings import (
+    IMDB_SEASON_URL,
+    IMDB_SEARCH_URL,
+    SEARCH_CACHE_TTL,
+    SEARCH_CACHE_SIZE,
+)
+from ..utils.cache import ttl_memoize
 from urllib.parse import quote_plus
 
 
@@ -589,6 +595,11 @@ class IMDBScraper(BaseScraper):
         self.logger.warning(f"Could not parse episode code: {code}")
         return None, None
     
+    @ttl_memoize(
+        maxsize=SEARCH_CACHE_SIZE,
+        ttl=SEARCH_CACHE_TTL,
+        key=lambda self, query, max_results=5: (query.strip().lower(), max_results)
+    )
     def search_series(self, query: str, max_results: int = 5) -> List[SearchResult]:
         """
         Search IMDB for TV series by name.
@@ -596,6 +607,9 @@ class IMDBScraper(BaseScraper):
         This method enables the user-friendly "add by name" feature.
         It searches IMDB and returns matching TV series with their IMDB IDs.
         
+        Results are memoized per normalized query (SEARCH_CACHE_TTL), so
+        repeating a search in the same session skips the HTTP round-trip.
+        
         Args:
             query: Series name to search for (e.g., "Breaking Bad")
             max_results: Maximum number of results to return (default: 5)
@@ -61,7 +61,8 @@ from urllib.parse import quote_plus
 
 from .base_scraper import BaseScraper
 from .http_client import HTTPClient, FetchError
-from ..config.settings import USER_AGENT
+from ..config.settings import USER_AGENT, VIDEO_SEARCH_CACHE_TTL, VIDEO_SEARCH_CACHE_SIZE
+from ..utils.cache import ttl_memoize
 
 
 # YouTube base URL for search
@@ -411,6 +412,13 @@ class YouTubeScraper(BaseScraper):
         self.extractor = YouTubeJSONExtractor()
         self.extractor.logger = self.logger
     
+    @ttl_memoize(
+        maxsize=VIDEO_SEARCH_CACHE_SIZE,
+        ttl=VIDEO_SEARCH_CACHE_TTL,
+        key=lambda self, series_name, episode_code, episode_title=None, max_results=5: (
+            series_name.strip().lower(), episode_code.upper(), episode_title, max_results
+        )
+    )
     def search_episode_videos(
         self,
         series_name: str,
@@ -427,6 +435,10 @@ class YouTubeScraper(BaseScraper):
         3. Parses and deduplicates videos
         4. Returns top results
         
+        Results are memoized per (series, episode, title, count) for
+        VIDEO_SEARCH_CACHE_TTL, so repeating a search in the same session
+        skips the several YouTube requests behind it.
+        
         Args:
             series_name: Name of the TV series
             episode_code: Episode code (e.g., "S01E04")
@@ -471,6 +483,11 @@ class YouTubeScraper(BaseScraper):
         # Return top results
         return relevant_videos[:max_results]
     
+    @ttl_memoize(
+        maxsize=VIDEO_SEARCH_CACHE_SIZE,
+        ttl=VIDEO_SEARCH_CACHE_TTL,
+        key=lambda self, series_name, max_results=5: (series_name.strip().lower(), max_results)
+    )
     def search_series_trailers(
         self,
         series_name: str,
@@ -480,6 +497,7 @@ class YouTubeScraper(BaseScraper):
         Search for general series trailers (not episode-specific).
         
         Useful for series overview or when no specific episode is targeted.
+        Memoized like search_episode_videos().
         
         Args:
             series_name: Name of the TV series
@@ -3,15 +3,35 @@ Services module for BingeWatch.
 Contains business logic services that orchestrate between database and scrapers.
 """
 
-from .episode_ranker import EpisodeRanker, PrioritizedEpisode
-from .video_cache import VideoCache, CachedVideo
-from .notification_service import NotificationService, Notification
+import importlib
+
+# Re-exports are resolved on first access (PEP 562), so importing one
+# service module doesn't import every other service and its scrapers
+_EXPORTS = {
+    'EpisodeRanker': '.episode_ranker',
+    'PrioritizedEpisode': '.episode_ranker',
+    'VideoCache': '.video_cache',
+    'CachedVideo': '.video_cache',
+    'WatchlistCache': '.watchlist_cache',
+    'NotificationService': '.notification_service',
+    'Notification': '.notification_service',
+}
 
 __all__ = [
     'EpisodeRanker', 
     'PrioritizedEpisode',
     'VideoCache',
     'CachedVideo',
+    'WatchlistCache',
     'NotificationService',
     'Notification'
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -25,15 +25,18 @@ Exemplu rezultat:
     3. [7]  The Office S02E05
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
+from ..config.settings import WATCHLIST_MAX_WORKERS
 from ..database.db_manager import DBManager
 from ..database.models import Series, Episode
 from ..scrapers.imdb_scraper import IMDBScraper
 from ..utils.logger import get_logger
+from .watchlist_cache import WatchlistCache
 
 
-@dataclass
+@dataclass(slots=True)
 class PrioritizedEpisode:
     """
     An episode enriched with series information for ranking display.
@@ -102,7 +105,8 @@ class EpisodeRanker:
     ===========================
     - This makes N network requests (one per series per season)
     - For 10 series with ~5 seasons each = ~50 HTTP requests
-    - Could be slow; consider caching in future phases
+    - Series are fetched in parallel (WATCHLIST_MAX_WORKERS threads)
+    - EpisodesCommand also caches the result (see WatchlistCache)
     
     ERROR HANDLING:
     ===============
@@ -127,12 +131,25 @@ class EpisodeRanker:
         self.db_manager = db_manager
         self.scraper = scraper or IMDBScraper()
         self.logger = get_logger()
+        self._cache: Optional[WatchlistCache] = None
+    
+    @property
+    def cache(self) -> WatchlistCache:
+        """On-disk watchlist cache, loaded on first use."""
+        if self._cache is None:
+            self._cache = WatchlistCache()
+        return self._cache
     
     def get_prioritized_watchlist(
         self, 
         include_snoozed: bool = False,
         min_score: Optional[int] = None,
-        max_results: Optional[int] = None
+        max_results: Optional[int] = None,
+        series_like: Optional[str] = None,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
+        cache_max_age: Optional[float] = None,
+        max_workers: int = WATCHLIST_MAX_WORKERS
     ) -> List[PrioritizedEpisode]:
         """
         Get all new episodes ranked by priority.
@@ -163,56 +180,59 @@ class EpisodeRanker:
             include_snoozed: Whether to include snoozed series (default: False)
             min_score: Minimum score to include (e.g., 7 = only 7+ series)
             max_results: Maximum episodes to return (for pagination)
+            series_like: Only series whose name contains this text
+                         (case-insensitive)
+            use_cache: Reuse/store the result in the on-disk WatchlistCache,
+                       keyed by the filters and the series table state
+            refresh_cache: With use_cache, skip the lookup and rebuild
+            cache_max_age: With use_cache, only reuse a result at most this
+                           many seconds old (default: the cache TTL)
+            max_workers: Series fetched from IMDB in parallel; 1 fetches
+                         them in turn
         
         Returns:
             List of PrioritizedEpisode objects, sorted by priority
         """
         self.logger.debug("Building prioritized watchlist...")
         
-        # Pas 1: Ia toate seriile din baza de date
-        all_series = self.db_manager.get_all_series(include_snoozed=include_snoozed)
+        # Pas 0: Rezultat din cache, daca seriile nu s-au schimbat
+        cache_key = None
+        if use_cache:
+            cache_key = self.cache.make_key(
+                self.db_manager.get_series_state_hash(),
+                include_snoozed, min_score, series_like
+            )
+            cached = None if refresh_cache else self.cache.get(cache_key, cache_max_age)
+            if cached is not None:
+                return cached[:max_results] if max_results is not None else cached
+        
+        # Pas 1-2: Ia seriile din baza de date, filtrate direct in SQL
+        # (snooze, scor minim, nume) ca sa nu cerem IMDB pentru serii ignorate
+        all_series = self.db_manager.get_all_series(
+            include_snoozed=include_snoozed,
+            min_score=min_score,
+            name_like=series_like
+        )
         
         if not all_series:
             self.logger.debug("No series in database")
             return []
         
-        # Pas 2: Filtreaza dupa scor minim
-        if min_score is not None:
-            all_series = [s for s in all_series if s.score >= min_score]
+        # Pas 3: Colecteaza episoadele noi de la fiecare serie, in paralel
+        # (fiecare serie inseamna cereri IMDB; map() pastreaza ordinea seriilor)
+        if max_workers > 1 and len(all_series) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                per_series = list(pool.map(self._fetch_series_episodes, all_series))
+        else:
+            per_series = [self._fetch_series_episodes(series) for series in all_series]
         
-        # Pas 3: Colecteaza episoadele noi de la fiecare serie
         all_prioritized: List[PrioritizedEpisode] = []
-        
-        for series in all_series:
-            try:
-                # Sari peste seriile snoozed
-                if series.snoozed and not include_snoozed:
-                    continue
-                
-                # Ia episoadele noi de pe IMDB
-                new_episodes = self.scraper.get_new_episodes(
-                    series.imdb_id,
-                    series.last_episode
-                )
-                
-                # Converteste la obiecte PrioritizedEpisode
-                for ep in new_episodes:
-                    prioritized = PrioritizedEpisode(
-                        series_name=series.name,
-                        series_imdb_id=series.imdb_id,
-                        score=series.score,
-                        season=ep.season,
-                        episode_number=ep.episode,
-                        episode_title=ep.title,
-                        air_date=ep.air_date
-                    )
-                    all_prioritized.append(prioritized)
-                self.logger.debug(f"Found {len(new_episodes)} episodes for {series.name}")
-            
-            except Exception as e:
-                # Nu lasa o eroare sa opreasca tot procesul
-                self.logger.error(f"Error fetching {series.name}: {e}")
-                continue
+        had_errors = False
+        for episodes in per_series:
+            if episodes is None:
+                had_errors = True
+            else:
+                all_prioritized.extend(episodes)
         
         # Pas 4: Sorteaza dupa prioritate (scor descrescator, apoi episod crescator)
         all_prioritized.sort(
@@ -223,6 +243,10 @@ class EpisodeRanker:
         for rank, ep in enumerate(all_prioritized, 1):
             ep.priority_rank = rank
         
+        # Rezultatele partiale (erori de retea) nu se pun in cache
+        if cache_key is not None and not had_errors:
+            self.cache.put(cache_key, all_prioritized)
+        
         # Pas 6: Aplica limita daca e specificata
         if max_results is not None:
             all_prioritized = all_prioritized[:max_results]
@@ -230,16 +254,65 @@ class EpisodeRanker:
         self.logger.debug(f"Watchlist complete: {len(all_prioritized)} episodes to watch")
         return all_prioritized
     
-    def get_next_episode(self) -> Optional[PrioritizedEpisode]:
+    def _fetch_series_episodes(self, series: Series) -> Optional[List[PrioritizedEpisode]]:
+        """
+        Get one series' new episodes from IMDB (used by get_prioritized_watchlist).
+        
+        Args:
+            series: Series to check
+        
+        Returns:
+            List of PrioritizedEpisode, or None if fetching failed
+        """
+        try:
+            new_episodes = self.scraper.get_new_episodes(
+                series.imdb_id,
+                series.last_episode
+            )
+        except Exception as e:
+            # Nu lasa o eroare sa opreasca tot procesul
+            self.logger.error(f"Error fetching {series.name}: {e}")
+            return None
+        
+        self.logger.debug(f"Found {len(new_episodes)} episodes for {series.name}")
+        return [
+            PrioritizedEpisode(
+                series_name=series.name,
+                series_imdb_id=series.imdb_id,
+                score=series.score,
+                season=ep.season,
+                episode_number=ep.episode,
+                episode_title=ep.title,
+                air_date=ep.air_date
+            )
+            for ep in new_episodes
+        ]
+    
+    def get_next_episode(
+        self,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
+        cache_max_age: Optional[float] = None
+    ) -> Optional[PrioritizedEpisode]:
         """
         Get the single highest-priority episode to watch next.
         
         Convenience method for "I just want ONE recommendation".
         
+        Args:
+            use_cache: Reuse/store the watchlist in the WatchlistCache
+            refresh_cache: With use_cache, skip the lookup and rebuild
+            cache_max_age: With use_cache, max age (seconds) of a reused result
+        
         Returns:
             The #1 priority episode, or None if nothing to watch
         """
-        watchlist = self.get_prioritized_watchlist(max_results=1)
+        watchlist = self.get_prioritized_watchlist(
+            max_results=1,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+            cache_max_age=cache_max_age
+        )
         return watchlist[0] if watchlist else None
     
     def get_episodes_by_series(
@@ -289,7 +362,8 @@ class EpisodeRanker:
             - series_with_new: Number of series with new episodes
             - highest_priority_series: Name of top-scored series with new eps
         """
-        watchlist = self.get_prioritized_watchlist()
+        # Same cached watchlist 'episodes' and 'watchlist' use
+        watchlist = self.get_prioritized_watchlist(use_cache=True)
         
         if not watchlist:
             return {
@@ -298,11 +372,8 @@ class EpisodeRanker:
                 'highest_priority_series': None
             }
         
-        # Count unique series
-        series_names = set(ep.series_name for ep in watchlist)
-        
         return {
             'total_episodes': len(watchlist),
-            'series_with_new': len(series_names),
-            'highest_priority_series': watchlist[0].series_name if watchlist else None
+            'series_with_new': len({ep.series_name for ep in watchlist}),
+            'highest_priority_series': watchlist[0].series_name
         }
@@ -26,6 +26,9 @@ FLUX DE LUCRU:
 """
 
 
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
@@ -54,6 +57,10 @@ class Notification:
     timestamp: str = ""
     
     def __post_init__(self):
+        # Interned so grouping/comparisons in the report hit the identity
+        # fast path (names repeat for every episode of a series)
+        self.series_name = sys.intern(self.series_name)
+        self.episode_code = sys.intern(self.episode_code)
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
     
@@ -122,12 +129,15 @@ class NotificationService:
         self.imdb = imdb_scraper or IMDBScraper()
         self.cache = video_cache or VideoCache()
         self.logger = get_logger()
+        # Serializes cache reads/writes when series are checked in parallel
+        self._cache_lock = threading.Lock()
     
     def check_all(
         self,
         include_snoozed: bool = False,
         max_episodes_per_series: int = 3,
-        min_score: Optional[int] = None
+        min_score: Optional[int] = None,
+        max_workers: int = 1
     ) -> List[Notification]:
         """
         Check all series for new YouTube videos.
@@ -138,14 +148,14 @@ class NotificationService:
             include_snoozed: Whether to check snoozed series
             max_episodes_per_series: Max episodes to check per series
             min_score: Minimum series score to check
+            max_workers: Series checked in parallel (the work is mostly
+                         waiting on IMDB/YouTube); 1 checks them in turn
             
         Returns:
             List of Notification objects for series with new videos
         """
         self.logger.info("Starting notification check for all series...")
         
-        notifications: List[Notification] = []
-        
         # Get all series
         series_list = self.db_manager.get_all_series(include_snoozed=include_snoozed)
         
@@ -154,38 +164,19 @@ class NotificationService:
         
         self.logger.info(f"Checking {len(series_list)} series for new videos")
         
-        for series in series_list:
-            try:
-                # Get new episodes for this series
-                new_episodes = self.imdb.get_new_episodes(
-                    series.imdb_id,
-                    series.last_episode
-                )
-                
-                # Limit episodes to check
-                episodes_to_check = new_episodes[:max_episodes_per_series]
-                
-                if not episodes_to_check:
-                    continue
-                
-                # Check each episode for new videos
-                for episode in episodes_to_check:
-                    notif = self._check_episode(
-                        series.name,
-                        episode.episode_code,
-                        episode.title
-                    )
-                    if notif and notif.count > 0:
-                        notifications.append(notif)
-                
-                # Also check for general series trailers
-                general_notif = self._check_series_general(series.name)
-                if general_notif and general_notif.count > 0:
-                    notifications.append(general_notif)
-            
-            except Exception as e:
-                self.logger.error(f"Error checking {series.name}: {e}")
-                continue
+        def check_one(series) -> List[Notification]:
+            return self._check_series_videos(series, max_episodes_per_series)
+        
+        if max_workers > 1 and len(series_list) > 1:
+            # map() keeps results in series order
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                per_series = list(pool.map(check_one, series_list))
+        else:
+            per_series = [check_one(series) for series in series_list]
+        
+        notifications: List[Notification] = [
+            notif for series_notifs in per_series for notif in series_notifs
+        ]
         
         # Log summary
         total_new = sum(n.count for n in notifications)
@@ -196,6 +187,56 @@ class NotificationService:
         
         return notifications
     
+    def _check_series_videos(
+        self,
+        series,
+        max_episodes: int
+    ) -> List[Notification]:
+        """
+        Check one series' new episodes and general trailers (used by check_all).
+        
+        Args:
+            series: Series to check
+            max_episodes: Max episodes to check
+        
+        Returns:
+            List of Notifications for this series (empty on error)
+        """
+        notifications: List[Notification] = []
+        
+        try:
+            # Get new episodes for this series
+            new_episodes = self.imdb.get_new_episodes(
+                series.imdb_id,
+                series.last_episode
+            )
+            
+            # Limit episodes to check
+            episodes_to_check = new_episodes[:max_episodes]
+            
+            if not episodes_to_check:
+                return notifications
+            
+            # Check each episode for new videos
+            for episode in episodes_to_check:
+                notif = self._check_episode(
+                    series.name,
+                    episode.episode_code,
+                    episode.title
+                )
+                if notif and notif.count > 0:
+                    notifications.append(notif)
+            
+            # Also check for general series trailers
+            general_notif = self._check_series_general(series.name)
+            if general_notif and general_notif.count > 0:
+                notifications.append(general_notif)
+        
+        except Exception as e:
+            self.logger.error(f"Error checking {series.name}: {e}")
+        
+        return notifications
+    
     def check_series(
         self,
         imdb_id: str,
@@ -267,11 +308,12 @@ class NotificationService:
                 return None
             
             # Compare against cache
-            new_videos = self.cache.get_new_videos(
-                series_name=series_name,
-                episode_code=episode_code,
-                current_videos=all_videos
-            )
+            with self._cache_lock:
+                new_videos = self.cache.get_new_videos(
+                    series_name=series_name,
+                    episode_code=episode_code,
+                    current_videos=all_videos
+                )
             
             if new_videos:
                 self.logger.info(
@@ -309,11 +351,12 @@ class NotificationService:
             if not all_videos:
                 return None
             
-            new_videos = self.cache.get_new_videos(
-                series_name=series_name,
-                episode_code=None,  # General means no specific episode
-                current_videos=all_videos
-            )
+            with self._cache_lock:
+                new_videos = self.cache.get_new_videos(
+                    series_name=series_name,
+                    episode_code=None,  # General means no specific episode
+                    current_videos=all_videos
+                )
             
             if new_videos:
                 return Notification(
@@ -27,6 +27,13 @@ STRUCTURA CACHE:
 
 Cheia: "{nume_serie}|{cod_episod}" sau "{nume_serie}|general"
 
+FORMAT FISIER:
+==============
+- Cache-ul se salveaza ca pickle (data/video_cache.pickle)
+- Versiunile vechi foloseau JSON (data/video_cache.json); acesta se
+  converteste o singura data, apoi se redenumeste in
+  video_cache.json.migrated, ca sa nu ramana o copie invechita
+
 SMART CACHING:
 ==============
 - TTL (Time-To-Live): Intrarile mai vechi de CACHE_TTL_DAYS sunt stale
@@ -36,6 +43,8 @@ SMART CACHING:
 
 
 import json
+import pickle
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set
@@ -46,8 +55,13 @@ from ..utils.logger import get_logger
 from ..scrapers.youtube_scraper import VideoResult
 
 
-# Cache file path
-CACHE_FILE = DB_DIR / "video_cache.json"
+# Cache file path (pickle: several times faster to load/save than JSON)
+CACHE_FILE = DB_DIR / "video_cache.pickle"
+
+# Older versions stored the cache as JSON; it is migrated on first load,
+# then renamed so the stale copy is never read (or edited) again
+LEGACY_CACHE_FILE = DB_DIR / "video_cache.json"
+MIGRATED_CACHE_FILE = DB_DIR / "video_cache.json.migrated"
 
 
 @dataclass
@@ -86,12 +100,12 @@ class CachedVideo:
         )
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for serialization."""
         return asdict(self)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'CachedVideo':
-        """Create from dictionary (JSON deserialization)."""
+        """Create from dictionary (deserialization)."""
         return cls(**data)
 
 
@@ -100,7 +114,7 @@ class VideoCache:
     Manages persistent storage of found YouTube videos.
     
     This class provides:
-    1. STORAGE: Save video findings to JSON file
+    1. STORAGE: Save video findings to a pickle file
     2. LOOKUP: Check if a video was previously found
     3. COMPARISON: Identify new videos vs cached ones
     4. TIMESTAMPS: Track when videos were discovered
@@ -109,6 +123,7 @@ class VideoCache:
     ==============
     This implementation is NOT thread-safe. For single-user CLI,
     this is fine. Would need locking for multi-threaded use.
+    Only the lookup counters (get_observability) have their own lock.
     
     CACHE KEYS:
     ===========
@@ -131,6 +146,11 @@ class VideoCache:
         # new_videos contains only videos not previously cached
     """
     
+    # Lookup counters for get_observability(), shared by every instance
+    # in the process
+    _lookups = {'hits': 0, 'misses': 0}
+    _counter_lock = threading.Lock()
+    
     def __init__(self, cache_path: Optional[Path] = None):
         """
         Initialize video cache.
@@ -141,35 +161,60 @@ class VideoCache:
         self.cache_path = cache_path or CACHE_FILE
         self.logger = get_logger()
         self._cache: Dict[str, Dict] = {}
+        self._stats: Optional[dict] = None  # Memoized get_stats(), reset on save
         self._load_cache()
     
     def _load_cache(self):
-        """Load cache from JSON file."""
+        """Load cache from the pickle file (migrating the old JSON cache)."""
+        self._stats = None
         if self.cache_path.exists():
             try:
-                with open(self.cache_path, 'r', encoding='utf-8') as f:
-                    self._cache = json.load(f)
+                with open(self.cache_path, 'rb') as f:
+                    self._cache = pickle.load(f)
                 self.logger.debug(f"Loaded cache with {len(self._cache)} entries")
-            except json.JSONDecodeError:
+            except (pickle.UnpicklingError, EOFError):
                 self.logger.warning("Cache file corrupted, starting fresh")
                 self._cache = {}
             except Exception as e:
                 self.logger.error(f"Error loading cache: {e}")
                 self._cache = {}
+        elif self.cache_path == CACHE_FILE and LEGACY_CACHE_FILE.exists():
+            self._migrate_legacy_cache()
         else:
             self._cache = {}
     
-    def _save_cache(self):
-        """Save cache to JSON file."""
+    def _migrate_legacy_cache(self):
+        """One-time conversion of the old JSON cache file to pickle."""
+        try:
+            with open(LEGACY_CACHE_FILE, 'r', encoding='utf-8') as f:
+                self._cache = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            self.logger.warning(f"Could not migrate old JSON cache, starting fresh: {e}")
+            self._cache = {}
+            return
+        
+        if not self._save_cache():
+            return
+        self.logger.info(f"Migrated video cache to {self.cache_path.name}")
+        try:
+            LEGACY_CACHE_FILE.replace(MIGRATED_CACHE_FILE)
+        except OSError as e:
+            self.logger.warning(f"Could not rename old JSON cache: {e}")
+    
+    def _save_cache(self) -> bool:
+        """Save cache to the pickle file; returns True if it was written."""
+        self._stats = None  # Every change is saved, so stats are stale now
         try:
             # Ensure directory exists
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, indent=2, ensure_ascii=False)
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump(self._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
             self.logger.debug("Cache saved successfully")
+            return True
         except Exception as e:
             self.logger.error(f"Error saving cache: {e}")
+            return False
     
     def _make_key(self, series_name: str, episode_code: Optional[str] = None) -> str:
         """
@@ -196,7 +241,11 @@ class VideoCache:
         Returns:
             Set of video IDs
         """
-        entry = self._cache.get(key, {})
+        entry = self._cache.get(key)
+        with VideoCache._counter_lock:
+            VideoCache._lookups['misses' if entry is None else 'hits'] += 1
+        if entry is None:
+            return set()
         return set(entry.get('video_ids', []))
     
     def get_new_videos(
@@ -328,19 +377,48 @@ class VideoCache:
         """
         Get cache statistics.
         
+        Computed once and reused until the cache changes.
+        
         Returns:
             Dict with stats about cached videos
         """
-        total_keys = len(self._cache)
-        total_videos = sum(
-            len(entry.get('video_ids', []))
-            for entry in self._cache.values()
-        )
+        if self._stats is None:
+            total_keys = len(self._cache)
+            total_videos = sum(
+                len(entry.get('video_ids', []))
+                for entry in self._cache.values()
+            )
+            
+            self._stats = {
+                'total_entries': total_keys,
+                'total_videos': total_videos,
+                'cache_path': str(self.cache_path)
+            }
+        
+        return dict(self._stats)
+    
+    def get_observability(self) -> dict:
+        """
+        Get lookup counters for this process (shared by all instances,
+        so 'stats' also sees lookups made by 'check').
         
+        Returns:
+            Dict with hits, misses, hit_ratio (None before any lookup),
+            entries and bytes (size of the cache file on disk)
+        """
+        with VideoCache._counter_lock:
+            hits, misses = VideoCache._lookups['hits'], VideoCache._lookups['misses']
+        lookups = hits + misses
+        try:
+            size = self.cache_path.stat().st_size
+        except OSError:
+            size = 0
         return {
-            'total_entries': total_keys,
-            'total_videos': total_videos,
-            'cache_path': str(self.cache_path)
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / lookups if lookups else None,
+            'entries': len(self._cache),
+            'bytes': size
         }
     
     # ==========================================================================
@@ -473,13 +551,22 @@ class VideoCache:
                 'newest_days': None
             }
         
+        # One pass for both ages and stale count, with one clock read
+        now = datetime.now()
+        cutoff = now - timedelta(days=CACHE_TTL_DAYS)
         ages = []
-        for key in self._cache:
-            age = self.get_entry_age(key)
+        stale_count = 0
+        for entry in self._cache.values():
+            try:
+                check_time = datetime.fromisoformat(entry['last_checked'])
+            except (KeyError, ValueError, TypeError):
+                stale_count += 1  # Never checked counts as stale
+                continue
+            age = now - check_time
             if age:
                 ages.append(age.total_seconds() / 86400)  # Convert to days
-        
-        stale_count = self.count_stale_entries()
+            if check_time < cutoff:
+                stale_count += 1
         
         return {
             'total': len(self._cache),
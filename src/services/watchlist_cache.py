@@ -0,0 +1,149 @@
+"""
+Watchlist Cache - Stocare persistenta pentru lista de episoade prioritizate.
+
+RESPONSABILITATI:
+=================
+- Salveaza rezultatul EpisodeRanker.get_prioritized_watchlist() pe disc
+- Il returneaza la urmatoarea rulare fara a mai interoga IMDB
+- Invalideaza intrarile cand se schimba seriile sau dupa WATCHLIST_CACHE_TTL
+
+STRUCTURA CACHE:
+================
+{
+    "<cheie>": {
+        "ts": 1705314600.0,
+        "episodes": [PrioritizedEpisode, ...]
+    }
+}
+
+Cheia: hash peste filtrele cererii si amprenta tabelului series
+(DBManager.get_series_state_hash()), deci orice episod marcat ca vazut,
+serie adaugata/stearsa sau scor schimbat produce o cheie noua.
+"""
+
+
+import hashlib
+import pickle
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config.settings import DB_DIR, WATCHLIST_CACHE_TTL
+from ..utils.logger import get_logger
+
+
+# Cache file path
+WATCHLIST_CACHE_FILE = DB_DIR / "watchlist_cache.pickle"
+
+
+class WatchlistCache:
+    """
+    Persistent cache of prioritized watchlists.
+    
+    Entries are keyed by the request filters and the series state, and
+    expire after `ttl` seconds so newly aired episodes still show up.
+    
+    USAGE:
+    ======
+        cache = WatchlistCache()
+        key = cache.make_key(state_hash, include_snoozed, min_score, series_like)
+        
+        episodes = cache.get(key)
+        if episodes is None:
+            episodes = build_watchlist()
+            cache.put(key, episodes)
+    """
+    
+    def __init__(self, cache_path: Optional[Path] = None, ttl: float = WATCHLIST_CACHE_TTL):
+        """
+        Initialize watchlist cache.
+        
+        Args:
+            cache_path: Optional custom path for cache file
+            ttl: Seconds an entry stays valid
+        """
+        self.cache_path = cache_path or WATCHLIST_CACHE_FILE
+        self.ttl = ttl
+        self.logger = get_logger()
+        self._cache: Dict[str, Dict] = self._load_cache()
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load cache from the pickle file."""
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Watchlist cache unreadable, starting fresh: {e}")
+            return {}
+    
+    def _save_cache(self):
+        """Save cache to the pickle file, dropping expired entries."""
+        now = time.time()
+        self._cache = {
+            key: entry for key, entry in self._cache.items()
+            if now - entry['ts'] < self.ttl
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump(self._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.error(f"Error saving watchlist cache: {e}")
+    
+    @staticmethod
+    def make_key(
+        state_hash: str,
+        include_snoozed: bool,
+        min_score: Optional[int],
+        series_like: Optional[str]
+    ) -> str:
+        """
+        Build the cache key for a watchlist request.
+        
+        Args:
+            state_hash: Fingerprint of the series table
+            include_snoozed: Whether snoozed series are included
+            min_score: Minimum score filter
+            series_like: Series name filter
+        
+        Returns:
+            Cache key string
+        """
+        raw = repr((state_hash, include_snoozed, min_score, series_like))
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[List]:
+        """
+        Get a cached watchlist.
+        
+        Args:
+            key: Cache key from make_key()
+            max_age: Optional stricter limit (seconds) than the cache TTL
+        
+        Returns:
+            List of PrioritizedEpisode, or None if missing or expired
+        """
+        ttl = self.ttl if max_age is None else min(max_age, self.ttl)
+        entry = self._cache.get(key)
+        if entry is None or time.time() - entry['ts'] >= ttl:
+            return None
+        self.logger.debug(f"Watchlist cache hit ({len(entry['episodes'])} episodes)")
+        return list(entry['episodes'])
+    
+    def put(self, key: str, episodes: List):
+        """
+        Store a watchlist.
+        
+        Args:
+            key: Cache key from make_key()
+            episodes: Full (unsliced) list of PrioritizedEpisode
+        """
+        self._cache[key] = {'ts': time.time(), 'episodes': list(episodes)}
+        self._save_cache()
+    
+    def clear(self):
+        """Remove all cached watchlists."""
+        self._cache = {}
+        self._save_cache()
@@ -13,11 +13,14 @@ from .logger import (
 )
 from .validators import (
     ValidationError,
+    Identifier,
+    parse_identifier,
     validate_series_name,
     validate_imdb_link,
     validate_score,
     validate_episode_format,
 )
+from .cache import ttl_memoize
 
 __all__ = [
     'get_logger',
@@ -28,8 +31,11 @@ __all__ = [
     'log_operation',
     'OperationLogger',
     'ValidationError',
+    'Identifier',
+    'parse_identifier',
     'validate_series_name',
     'validate_imdb_link',
     'validate_score',
     'validate_episode_format',
+    'ttl_memoize',
 ]
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+In-memory caching helpers.
+Provides a TTL + LRU memoization decorator for expensive lookups.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+
+def _detach(value):
+    """Return a shallow copy of list results (other values as-is)."""
+    return list(value) if isinstance(value, list) else value
+
+
+def ttl_memoize(maxsize=256, ttl=3600, key=None):
+    """
+    Memoize a function with LRU eviction and a time-to-live.
+
+    Entries are stored as (timestamp, value) in an OrderedDict. A hit
+    moves the entry to the end; when the cache is full the least
+    recently used entry is dropped. Entries older than `ttl` seconds
+    are treated as misses.
+
+    Falsy results (e.g., an empty list after a failed request) are not
+    cached, so the next call tries again.
+
+    List results are copied when stored and on every hit, so a caller
+    that sorts or trims its list cannot change what later callers get.
+    The copy is shallow: the items themselves are shared and must not
+    be mutated.
+    
+    The cache is guarded by a lock, so the wrapped function can be called
+    from several threads (the call itself runs outside the lock).
+    
+    Hits, misses, evictions (LRU or expired) and the time spent in the
+    wrapped function on misses are counted under the same lock.
+    
+    Args:
+        maxsize: Maximum number of cached entries
+        ttl: Time-to-live of an entry, in seconds
+        key: Optional function building the cache key from the call
+             arguments (defaults to the positional and keyword arguments)
+
+    Returns:
+        Decorator. The wrapped function gets `cache_clear()` (drops the
+        entries and resets the counters) and `cache_info()` (dict of the
+        counters above plus size/maxsize).
+
+    Usage:
+        @ttl_memoize(maxsize=128, ttl=600, key=lambda q: q.lower())
+        def search(q):
+            ...
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'miss_seconds': 0.0}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            else:
+                cache_key = (args, tuple(sorted(kwargs.items())))
+
+            with lock:
+                entry = cache.get(cache_key)
+                if entry is not None:
+                    stored_at, value = entry
+                    if time.monotonic() - stored_at < ttl:
+                        cache.move_to_end(cache_key)
+                        counters['hits'] += 1
+                        return _detach(value)
+                    del cache[cache_key]
+                    counters['evictions'] += 1
+                counters['misses'] += 1
+
+            started = time.monotonic()
+            value = func(*args, **kwargs)
+            finished = time.monotonic()
+            with lock:
+                counters['miss_seconds'] += finished - started
+                if value:
+                    cache[cache_key] = (finished, _detach(value))
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+                        counters['evictions'] += 1
+            return value
+
+        def cache_info():
+            with lock:
+                return dict(counters, size=len(cache), maxsize=maxsize)
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+                counters.update(hits=0, misses=0, evictions=0, miss_seconds=0.0)
+        
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        return wrapper
+
+    return decorator
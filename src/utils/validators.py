@@ -4,15 +4,96 @@ Provides reusable validation functions for user inputs.
 """
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal, Optional
 from urllib.parse import urlparse
 from ..config.settings import MIN_SCORE, MAX_SCORE, IMDB_ID_PREFIX
 
 
+# Classifies a raw argument in one pass: a well-formed ID ("tt" + 7+ digits),
+# anything else starting with "tt", or an imdb.com URL
+_IDENTIFIER_RE = re.compile(
+    r'(?P<id>tt(?P<digits>\d{7,}$)?)|(?P<url>.*imdb\.com)', re.IGNORECASE
+)
+_IMDB_ID_RE = re.compile(r'^tt\d{7,}$')
+
+# Episode formats accepted by validate_episode_format()
+_EPISODE_SXE_RE = re.compile(r'S(\d+)E(\d+)', re.IGNORECASE)
+_EPISODE_X_RE = re.compile(r'(\d+)x(\d+)', re.IGNORECASE)
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
+@dataclass(frozen=True)
+class Identifier:
+    """
+    A command argument classified once by parse_identifier().
+    
+    Attributes:
+        kind: 'id' (starts like an IMDB ID), 'url' (imdb.com URL),
+              'score' (integer in the score range) or 'name'
+        value: The stripped argument
+        imdb_id: Extracted IMDB ID, or None if there is no valid one
+    """
+    kind: Literal['id', 'url', 'name', 'score']
+    value: str
+    imdb_id: Optional[str] = None
+    
+    @property
+    def is_imdb(self) -> bool:
+        """True if the argument looks like an IMDB ID or URL."""
+        return self.kind in ('id', 'url')
+
+
+def _extract_imdb_id_from_path(link):
+    """Return the first valid 'tt...' segment of a URL path, or None."""
+    for part in urlparse(link).path.split('/'):
+        if part.startswith(IMDB_ID_PREFIX) and _IMDB_ID_RE.match(part):
+            return part
+    return None
+
+
+@lru_cache(maxsize=256)
+def parse_identifier(value):
+    """
+    Classify and normalize a command argument in a single pass.
+    
+    Lets callers decide "IMDB ID, URL, score or name?" and get the
+    extracted IMDB ID from the same result, instead of re-parsing the
+    argument at every step. Results are memoized, so an argument typed
+    again (common in the interactive shell) is not parsed twice.
+    
+    Args:
+        value: Raw argument string
+    
+    Returns:
+        Identifier: The classified argument
+    """
+    text = value.strip() if value else ""
+    
+    match = _IDENTIFIER_RE.match(text)
+    if match:
+        if match.group('id') is not None:
+            well_formed = match.group('digits') and text.startswith(IMDB_ID_PREFIX)
+            return Identifier('id', text, text if well_formed else None)
+        try:
+            return Identifier('url', text, _extract_imdb_id_from_path(text))
+        except ValueError:  # Malformed URL (e.g., bad IPv6 host)
+            return Identifier('url', text)
+    
+    try:
+        if MIN_SCORE <= int(text) <= MAX_SCORE:
+            return Identifier('score', text)
+    except ValueError:
+        pass
+    
+    return Identifier('name', text)
+
+
 def validate_series_name(name):
     """
     Validate series name.
@@ -36,12 +117,16 @@ def validate_series_name(name):
     return cleaned_name
 
 
+@lru_cache(maxsize=256)
 def validate_imdb_link(link):
     """
     Validate and extract IMDB ID from link.
     
+    Successful results are memoized; invalid links raise every time.
+    
     Args:
-        link: IMDB URL or ID string
+        link: IMDB URL or ID string, or an Identifier already returned
+              by parse_identifier() (avoids parsing the argument again)
         
     Returns:
         str: Extracted IMDB ID (e.g., 'tt1234567')
@@ -49,31 +134,31 @@ def validate_imdb_link(link):
     Raises:
         ValidationError: If link is invalid
     """
-    if not link or not link.strip():
+    ident = link if isinstance(link, Identifier) else parse_identifier(link)
+    
+    if not ident.value:
         raise ValidationError("IMDB link cannot be empty")
     
+    if ident.imdb_id:
+        return ident.imdb_id
+    
     # If it's already an ID (starts with 'tt')
-    if link.startswith(IMDB_ID_PREFIX):
-        imdb_id = link.strip()
-        if re.match(r'^tt\d{7,}$', imdb_id):
-            return imdb_id
-        raise ValidationError(f"Invalid IMDB ID format: {imdb_id}")
+    if ident.value.startswith(IMDB_ID_PREFIX):
+        raise ValidationError(f"Invalid IMDB ID format: {ident.value}")
     
-    # If it's a URL, extract the ID
-    try:
-        parsed = urlparse(link)
-        path_parts = parsed.path.split('/')
-        
-        # Find the part that starts with 'tt'
-        for part in path_parts:
-            if part.startswith(IMDB_ID_PREFIX):
-                if re.match(r'^tt\d{7,}$', part):
-                    return part
-        
-        raise ValidationError(f"Could not extract IMDB ID from URL: {link}")
+    # Not classified as a URL, but a path may still carry the ID
+    if ident.kind != 'url':
+        try:
+            imdb_id = _extract_imdb_id_from_path(ident.value)
+        except ValueError as e:
+            raise ValidationError(f"Invalid IMDB link: {ident.value} - {str(e)}")
+        if imdb_id:
+            return imdb_id
     
-    except Exception as e:
-        raise ValidationError(f"Invalid IMDB link: {link} - {str(e)}")
+    raise ValidationError(
+        f"Invalid IMDB link: {ident.value} - "
+        f"Could not extract IMDB ID from URL: {ident.value}"
+    )
 
 
 def validate_score(score):
@@ -119,12 +204,12 @@ def validate_episode_format(episode_str):
         raise ValidationError("Episode format cannot be empty")
     
     # Try S01E05 format
-    match = re.match(r'S(\d+)E(\d+)', episode_str.upper())
+    match = _EPISODE_SXE_RE.match(episode_str)
     if match:
         return int(match.group(1)), int(match.group(2))
     
     # Try 1x5 format
-    match = re.match(r'(\d+)x(\d+)', episode_str.lower())
+    match = _EPISODE_X_RE.match(episode_str)
     if match:
         return int(match.group(1)), int(match.group(2))
     
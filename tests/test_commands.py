@@ -0,0 +1,136 @@
+"""
+Tests for command argument parsing and batch commands.
+"""
+
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.commands.add_command import AddCommand
+from src.commands.episodes_command import _parse_args as parse_episodes_args
+from src.database.db_manager import DBManager
+from src.main import BingeWatchCLI
+
+
+class EpisodesParseArgsTest(unittest.TestCase):
+    """_parse_args() of the episodes command."""
+
+    def test_int_flag_does_not_swallow_following_flag(self):
+        parsed = parse_episodes_args(['--top', '--all'])
+        self.assertTrue(parsed['all'])
+        self.assertIsNone(parsed['top'])
+
+    def test_int_flag_takes_its_value(self):
+        parsed = parse_episodes_args(['--top', '3', '-a', '--min-score', '7'])
+        self.assertEqual(parsed['top'], 3)
+        self.assertEqual(parsed['min_score'], 7)
+        self.assertTrue(parsed['all'])
+        self.assertIsNone(parsed['series_filter'])
+
+    def test_value_is_not_taken_as_series_filter(self):
+        parsed = parse_episodes_args(['-t', '5', 'Dark'])
+        self.assertEqual(parsed['top'], 5)
+        self.assertEqual(parsed['series_filter'], 'Dark')
+
+    def test_non_numeric_value_is_consumed(self):
+        parsed = parse_episodes_args(['--top', 'many', 'Dark'])
+        self.assertIsNone(parsed['top'])
+        self.assertEqual(parsed['series_filter'], 'Dark')
+
+
+class BatchTestCase(unittest.TestCase):
+    """Base class: a CLI over a fresh database in a temporary directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(Path(self._tmp.name) / "test.db")
+        with mock.patch("src.main.DBManager", return_value=self.db):
+            self.cli = BingeWatchCLI()
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def run_add_batch(self, text):
+        return self.cli.run_add_batch(io.StringIO(text))
+
+    def scores(self):
+        return {s.name: s.score for s in self.db.get_all_series(include_snoozed=True)}
+
+
+class AddBatchTest(BatchTestCase):
+    """'add-batch': AddCommand.bulk_execute() fed by run_add_batch()."""
+
+    def test_adds_rows_with_imdb_id(self):
+        result = self.run_add_batch("add Dark tt5753856 9\nLost tt0411008\n")
+        self.assertIn("Added 2 series", result)
+        self.assertEqual(self.scores(), {"Dark": 9, "Lost": 5})
+
+    def test_duplicate_rows_are_skipped(self):
+        self.run_add_batch("Lost tt0411008 7\n")
+        result = self.run_add_batch(
+            "Dark tt5753856 9\nDark tt5753856 4\nLost tt0411008 3\n"
+        )
+        self.assertIn("Added 1 series", result)
+        self.assertIn("Skipped 2 already tracked", result)
+        self.assertEqual(self.scores(), {"Dark": 9, "Lost": 7})
+
+    def test_invalid_lines_are_reported(self):
+        result = self.run_add_batch(
+            "Dark tt5753856 11\nBreaking Bad tt0903747\nLost tt0411008\n"
+        )
+        self.assertIn("Added 1 series", result)
+        self.assertIn("2 invalid line(s)", result)
+        self.assertIn("Line 1:", result)
+        self.assertIn("Line 2: use quotes", result)
+        self.assertEqual(self.scores(), {"Lost": 5})
+
+    def test_rows_without_imdb_id_use_execute(self):
+        with mock.patch.object(AddCommand, "execute", return_value="[OK] looked up") as execute:
+            result = self.run_add_batch('"Breaking Bad" 9\nDark tt5753856\n')
+        execute.assert_called_once_with(["Breaking Bad", "9"])
+        self.assertIn("Added 1 series", result)
+        self.assertIn("[OK] looked up", result)
+
+    def test_reading_stops_at_empty_line(self):
+        self.run_add_batch("Dark tt5753856\n\nLost tt0411008\n")
+        self.assertEqual(self.scores(), {"Dark": 5})
+
+    def test_empty_input(self):
+        self.assertTrue(self.run_add_batch("").startswith("[ERROR]"))
+
+
+class UpdateBatchTest(BatchTestCase):
+    """'update-batch': UpdateCommand.bulk_execute() fed by run_update_batch()."""
+
+    def setUp(self):
+        super().setUp()
+        self.run_add_batch("Dark tt5753856 9\nLost tt0411008 7\n")
+
+    def test_applies_valid_lines_and_reports_invalid(self):
+        result = self.cli.run_update_batch(io.StringIO(
+            "update score tt5753856 4\n"
+            "snooze Lost\n"
+            "episode tt0411008 S01E02\n"
+            "score tt9999999 5\n"
+            "rename Dark\n"
+            "score Dark\n"
+        ))
+        self.assertIn("Applied 3 update(s)", result)
+        self.assertIn("3 invalid line(s)", result)
+        self.assertIn("Line 4: Series with IMDB ID 'tt9999999' not found.", result)
+        self.assertIn("Line 5: unknown action 'rename'", result)
+        self.assertIn("Line 6:", result)
+        lost = self.db.get_series("tt0411008")
+        self.assertEqual((lost.snoozed, lost.last_episode), (1, "S01E02"))
+        self.assertEqual(self.scores()["Dark"], 4)
+
+    def test_empty_input(self):
+        result = self.cli.run_update_batch(io.StringIO("\n"))
+        self.assertTrue(result.startswith("[ERROR]"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Tests for DBManager name lookups and batch updates.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.database import db_manager
+from src.database.db_manager import DBManager
+from src.database.models import Series
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Base class: a fresh database in a temporary directory per test."""
+
+    NAMES = ()
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(Path(self._tmp.name) / "test.db")
+        self.db.add_series_many(
+            Series(name=name, imdb_id=f"tt{i:07d}")
+            for i, name in enumerate(self.NAMES, 1)
+        )
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+
+class FindByNameTest(DatabaseTestCase):
+    """find_by_name() must match names like Python's case-insensitive compare."""
+
+    NAMES = ("Élite", "Breaking Bad", "100%_Real", "ÇA")
+
+    def names(self, query, exact=False):
+        return sorted(s.name for s in self.db.find_by_name(query, exact=exact))
+
+    def test_exact_non_ascii(self):
+        self.assertEqual(self.names("élite", exact=True), ["Élite"])
+        self.assertEqual(self.names("ça", exact=True), ["ÇA"])
+
+    def test_exact_ascii(self):
+        self.assertEqual(self.names("breaking BAD", exact=True), ["Breaking Bad"])
+        self.assertEqual(self.names("bad", exact=True), [])
+
+    def test_substring_non_ascii(self):
+        self.assertEqual(self.names("élit"), ["Élite"])
+        self.assertEqual(self.names("ÉLI"), ["Élite"])
+
+    def test_substring_wildcards_are_literal(self):
+        self.assertEqual(self.names("%"), ["100%_Real"])
+        self.assertEqual(self.names("_r"), ["100%_Real"])
+        self.assertEqual(self.names("x"), [])
+
+    def test_get_all_series_name_like(self):
+        names = [s.name for s in self.db.get_all_series(name_like="élite")]
+        self.assertEqual(names, ["Élite"])
+        names = [s.name for s in self.db.get_all_series(name_like="%_r")]
+        self.assertEqual(names, ["100%_Real"])
+
+
+class FindDuplicatesTest(DatabaseTestCase):
+    """find_duplicates() must see every stored series, not a prefiltered few."""
+
+    NAMES = ("Up", "Lost", "Dark", "Friends")
+
+    def test_imdb_id_hit(self):
+        existing, similar = self.db.find_duplicates("tt0000002", "Anything")
+        self.assertEqual(existing.name, "Lost")
+        self.assertEqual(similar, [])
+
+    def test_similar_names_without_shared_word(self):
+        for new_name, expected in (
+            ("Upload", "Up"),      # stored name contained in the new one
+            ("Lots", "Lost"),      # short names, character overlap
+            ("Drak", "Dark"),
+            ("Fiends", "Friends"),
+        ):
+            existing, similar = self.db.find_duplicates("tt9999999", new_name)
+            self.assertIsNone(existing)
+            self.assertEqual([s.name for s in similar], [expected], new_name)
+
+
+class UpdateSeriesManyTest(DatabaseTestCase):
+    """update_series_many() on both the per-row and the merged score path."""
+
+    NAMES = ("Up", "Lost", "Dark", "Friends", "Dexter", "Fargo", "Ozark")
+
+    def scores(self):
+        return {s.imdb_id: s.score for s in self.db.get_all_series(include_snoozed=True)}
+
+    def update_scores(self, pairs):
+        with mock.patch.object(
+            self.db, "_update_scores_merged", wraps=self.db._update_scores_merged
+        ) as merged:
+            updated = self.db.update_series_many(scores=pairs)
+        return updated, merged.called
+
+    def test_few_rows_update_one_by_one(self):
+        updated, merged = self.update_scores([("tt0000001", 9), ("tt0000003", 2)])
+        self.assertFalse(merged)
+        self.assertEqual(updated, 2)
+        scores = self.scores()
+        self.assertEqual((scores["tt0000001"], scores["tt0000003"]), (9, 2))
+        self.assertEqual(scores["tt0000002"], 5)
+
+    def test_many_rows_are_merged(self):
+        pairs = [(f"tt{i:07d}", i) for i in range(1, 8)]
+        with mock.patch.object(db_manager, "_MERGE_CHUNK_ROWS", 3):
+            updated, merged = self.update_scores(pairs)
+        self.assertTrue(merged)
+        self.assertEqual(updated, 7)
+        self.assertEqual(self.scores(), dict(pairs))
+
+    def test_duplicate_ids_last_score_wins(self):
+        for pairs in (
+            [("tt0000001", 3), ("tt0000001", 8)],
+            [(f"tt{i:07d}", 1) for i in range(1, 8)] + [("tt0000004", 10)],
+        ):
+            updated, _ = self.update_scores(pairs)
+            self.assertEqual(updated, len(dict(pairs)))
+            self.assertEqual(self.scores()[pairs[-1][0]], pairs[-1][1])
+
+    def test_unknown_ids_are_not_counted(self):
+        pairs = [(f"tt{i:07d}", 4) for i in range(5, 11)]
+        updated, merged = self.update_scores(pairs)
+        self.assertTrue(merged)
+        self.assertEqual(updated, 3)
+
+    def test_rows_of_every_kind_are_counted(self):
+        updated = self.db.update_series_many(
+            scores=[("tt0000001", 9)],
+            snoozes=[("tt0000002", True)],
+            episodes=[("tt0000003", "S01E02"), ("tt9999999", "S01E01")]
+        )
+        self.assertEqual(updated, 3)
+        self.assertEqual(self.db.get_series("tt0000003").last_episode, "S01E02")
+
+    def test_series_cache_is_cleared(self):
+        for pairs in ([("tt0000001", 9)], [(f"tt{i:07d}", 8) for i in range(1, 8)]):
+            self.assertIsNotNone(self.db.get_series("tt0000001"))
+            self.db.update_series_many(scores=pairs)
+            self.assertEqual(self.db.get_series("tt0000001").score, pairs[0][1])
+
+
+def baseline_similar(name, stored_names, threshold=0.6):
+    """Original find_similar_by_name() rules, applied to every stored name."""
+    similar = []
+    name_lower = name.lower().strip()
+    name_words = set(name_lower.split())
+    for stored in stored_names:
+        stored_lower = stored.lower().strip()
+        stored_words = set(stored_lower.split())
+        if name_lower == stored_lower:
+            similar.append(stored)
+            continue
+        if name_lower in stored_lower or stored_lower in name_lower:
+            similar.append(stored)
+            continue
+        if name_words and stored_words:
+            intersection = len(name_words & stored_words)
+            union = len(name_words | stored_words)
+            if (intersection / union if union > 0 else 0) >= threshold:
+                similar.append(stored)
+                continue
+        if len(name_lower) <= 10 or len(stored_lower) <= 10:
+            common = sum(1 for c in name_lower if c in stored_lower)
+            max_len = max(len(name_lower), len(stored_lower))
+            if max_len > 0 and common / max_len >= threshold:
+                similar.append(stored)
+    return similar
+
+
+class SimilarNamesMatchBaselineTest(DatabaseTestCase):
+    """Duplicate detection must flag exactly what the original full scan flagged."""
+
+    NAMES = (
+        "Up", "Lost", "Dark", "Friends", "Breaking Bad", "Better Call Saul",
+        "Game of Thrones", "The Office", "The Office US", "Doctor Who",
+        "Élite", "It", "House of the Dragon", "Bad Sisters", "The Wire",
+    )
+    QUERIES = (
+        "Upload", "Lots", "Drak", "Fiends", "breaking", "Breaking Bad 2",
+        "Office", "The Offices", "Who", "élite", "ELITE", "It Crowd",
+        "Dragon House", "Sisters", "Wired", "Thrones", "Doctor", "x", "The",
+    )
+
+    def test_find_similar_by_name(self):
+        for threshold in (0.3, 0.6, 0.9):
+            for query in self.QUERIES:
+                got = sorted(s.name for s in self.db.find_similar_by_name(query, threshold))
+                expected = sorted(baseline_similar(query, self.NAMES, threshold))
+                self.assertEqual(got, expected, (query, threshold))
+
+    def test_find_duplicates(self):
+        for query in self.QUERIES:
+            existing, similar = self.db.find_duplicates("tt9999999", query)
+            self.assertIsNone(existing)
+            self.assertEqual(
+                sorted(s.name for s in similar),
+                sorted(baseline_similar(query, self.NAMES)),
+                query
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for EpisodeRanker ordering.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.database.db_manager import DBManager
+from src.database.models import Episode, Series
+from src.services.episode_ranker import EpisodeRanker
+from src.services.watchlist_cache import WatchlistCache
+
+
+class StubScraper:
+    """Returns the same new episodes for every series, latest first."""
+
+    calls = 0
+
+    def get_new_episodes(self, imdb_id, last_episode):
+        self.calls += 1
+        return [
+            Episode(series_imdb_id=imdb_id, season=season, episode=episode,
+                    title=f"Ep {episode}")
+            for season, episode in ((2, 1), (1, 3), (1, 1))
+        ]
+
+
+class RankerTestCase(unittest.TestCase):
+    """Base class: a ranker over a fresh temporary database and a stub scraper."""
+
+    SERIES = (("Lost", 7), ("Dark", 9), ("Up", 5), ("Friends", 9))
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(Path(self._tmp.name) / "test.db")
+        self.db.add_series_many(
+            Series(name=name, imdb_id=f"tt{i:07d}", score=score)
+            for i, (name, score) in enumerate(self.SERIES, 1)
+        )
+        self.ranker = EpisodeRanker(self.db, scraper=StubScraper())
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+
+class PrioritizedWatchlistTest(RankerTestCase):
+    """get_prioritized_watchlist() must rank by score, then episode order."""
+
+    def test_descending_score_order(self):
+        for max_workers in (1, 4):
+            watchlist = self.ranker.get_prioritized_watchlist(max_workers=max_workers)
+            scores = [ep.score for ep in watchlist]
+            self.assertEqual(scores, sorted(scores, reverse=True), max_workers)
+            self.assertEqual(len(watchlist), 3 * len(self.SERIES))
+
+    def test_episodes_in_order_within_series(self):
+        watchlist = self.ranker.get_prioritized_watchlist()
+        dark = [(ep.season, ep.episode_number)
+                for ep in watchlist if ep.series_name == "Dark"]
+        self.assertEqual(dark, [(1, 1), (1, 3), (2, 1)])
+        self.assertEqual([ep.priority_rank for ep in watchlist],
+                         list(range(1, len(watchlist) + 1)))
+
+    def test_max_results_keeps_top_ranked(self):
+        watchlist = self.ranker.get_prioritized_watchlist(max_results=2)
+        self.assertEqual([ep.score for ep in watchlist], [9, 9])
+
+
+class WatchlistCacheMaxAgeTest(RankerTestCase):
+    """cache_max_age must bound how old a reused watchlist can be."""
+
+    def setUp(self):
+        super().setUp()
+        self.ranker._cache = WatchlistCache(
+            cache_path=Path(self._tmp.name) / "watchlist_cache.pickle"
+        )
+
+    def test_recent_result_is_reused(self):
+        self.ranker.get_prioritized_watchlist(use_cache=True)
+        self.ranker.get_prioritized_watchlist(use_cache=True, cache_max_age=900)
+        self.assertEqual(self.ranker.scraper.calls, len(self.SERIES))
+
+    def test_older_result_is_rebuilt(self):
+        self.ranker.get_prioritized_watchlist(use_cache=True)
+        self.ranker.get_prioritized_watchlist(use_cache=True, cache_max_age=0)
+        self.assertEqual(self.ranker.scraper.calls, 2 * len(self.SERIES))
+
+
+if __name__ == "__main__":
+    unittest.main()